@@ -224,12 +224,15 @@ class ParallelMarketAnalyzer:
 
             # Add performance metrics
             total_time = time.time() - start_time
+            successful_times = [
+                r.execution_time for r in validation_results if r.success
+            ]
             validation_report["performance_metrics"] = {
                 "total_execution_time": total_time,
-                "parallel_efficiency": f"{len(validation_tasks) * min([r.execution_time for r in validation_results if r.success]) / total_time:.1f}x",
-                "successful_tasks": len([r for r in validation_results if r.success]),
-                "failed_tasks": len([r for r in validation_results if not r.success]),
-                "average_task_time": sum([r.execution_time for r in validation_results])
+                "parallel_efficiency": f"{len(validation_tasks) * min(successful_times) / total_time:.1f}x",
+                "successful_tasks": len(successful_times),
+                "failed_tasks": len(validation_results) - len(successful_times),
+                "average_task_time": sum(r.execution_time for r in validation_results)
                 / len(validation_results),
                 "execution_method": "pure_threading",
             }
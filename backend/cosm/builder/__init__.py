@@ -12,6 +12,7 @@ import re
 import base64
 import json
 import time
+from functools import lru_cache
 
 from cosm.config import MODEL_CONFIG
 from cosm.tools.pexels import get_pexels_media, get_curated_pexels_media
@@ -19,7 +20,11 @@ from cosm.prompts import BRAND_CREATOR_PROMPT, LANDING_BUILDER_PROMPT
 from cosm.settings import settings
 from cosm.utils import ResilientLlmAgent
 
-client = Client()
+
+@lru_cache(maxsize=1)
+def get_genai_client() -> Client:
+    """Get the shared Gemini client, created on first use instead of at import"""
+    return Client()
 
 
 # =============================================================================
@@ -1986,7 +1991,7 @@ def generate_logo_with_imagen(
         """
 
         # Generate image with Imagen
-        image_response = client.models.generate_images(
+        image_response = get_genai_client().models.generate_images(
             model="imagen-3.0-generate-002",
             prompt=logo_prompt,
             config=types.GenerateImagesConfig(
@@ -21,5 +21,8 @@ class Settings(BaseSettings):
 
     ENVIRONMENT: str = "development"
 
+    # Attach per-stage wall times to market validation reports
+    COSM_PROFILE: bool = False
+
 
 settings = Settings()
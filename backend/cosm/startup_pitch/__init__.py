@@ -9,17 +9,7 @@ from typing import Dict, Any
 import json
 import requests
 from datetime import datetime
-from reportlab.lib.pagesizes import A4
-from reportlab.platypus import (
-    SimpleDocTemplate,
-    Paragraph,
-    Spacer,
-    PageBreak,
-)
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.colors import HexColor
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from xml.sax.saxutils import escape
 import tempfile
 import os
 from cosm.config import MODEL_CONFIG
@@ -580,6 +570,19 @@ def generate_pitch_deck_pdf(
     Generate professional PDF pitch deck using ReportLab
     """
     try:
+        # ReportLab is heavy to import and only needed here, so load it on first use
+        from reportlab.lib.pagesizes import A4
+        from reportlab.platypus import (
+            SimpleDocTemplate,
+            Paragraph,
+            Spacer,
+            PageBreak,
+        )
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.lib.units import inch
+        from reportlab.lib.colors import HexColor
+        from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+
         # Create temporary file for PDF generation
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp_file:
             # Create PDF document
@@ -673,8 +676,14 @@ def generate_pitch_deck_pdf(
 
             # Key highlights
             story.append(Paragraph("Key Highlights:", heading_style))
-            for highlight in executive_summary.get("key_highlights", []):
-                story.append(Paragraph(f"• {highlight}", body_style))
+            highlights = executive_summary.get("key_highlights", [])
+            if highlights:
+                story.append(
+                    Paragraph(
+                        "<br/>".join(f"• {escape(str(h))}" for h in highlights),
+                        body_style,
+                    )
+                )
             story.append(PageBreak())
 
             # Additional pages following the same pattern as the original code...
@@ -720,8 +729,14 @@ def generate_pitch_deck_pdf(
             )
 
             story.append(Paragraph("Key Benefits:", body_style))
-            for benefit in solution.get("key_benefits", ["Market-driven solution"]):
-                story.append(Paragraph(f"• {benefit}", body_style))
+            benefits = solution.get("key_benefits", ["Market-driven solution"])
+            if benefits:
+                story.append(
+                    Paragraph(
+                        "<br/>".join(f"• {escape(str(b))}" for b in benefits),
+                        body_style,
+                    )
+                )
             story.append(PageBreak())
 
             # Continue with remaining pages...
@@ -752,11 +767,16 @@ def generate_pitch_deck_pdf(
                     )
                     story.append(Spacer(1, 0.1 * inch))
             else:
-                story.append(Paragraph("1. Validate market assumptions", body_style))
-                story.append(Paragraph("2. Develop MVP", body_style))
-                story.append(Paragraph("3. Secure initial funding", body_style))
-                story.append(Paragraph("4. Build core team", body_style))
-                story.append(Paragraph("5. Launch pilot program", body_style))
+                story.append(
+                    Paragraph(
+                        "1. Validate market assumptions<br/>"
+                        "2. Develop MVP<br/>"
+                        "3. Secure initial funding<br/>"
+                        "4. Build core team<br/>"
+                        "5. Launch pilot program",
+                        body_style,
+                    )
+                )
 
             story.append(Spacer(1, 0.5 * inch))
             story.append(Paragraph("Thank you for your consideration.", heading_style))
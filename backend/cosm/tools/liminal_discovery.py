@@ -3,15 +3,36 @@ Complete Liminal Discovery Tools
 This will find breakthrough opportunities like Uber, Airbnb, DoorDash
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
+import atexit
 import time
 from cosm.config import MODEL_CONFIG
 from cosm.settings import settings
 from cosm.tools.tavily import tavily_quick_search
 
+# Shared pool for the leaf tavily searches. Its size caps outstanding searches
+# across every discovery type and concurrent run, instead of each call
+# spinning up (and oversubscribing) its own threads.
+MAX_CONCURRENT_SEARCHES = 12
+search_pool = ThreadPoolExecutor(
+    max_workers=MAX_CONCURRENT_SEARCHES, thread_name_prefix="liminal-search"
+)
+atexit.register(search_pool.shutdown, wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second).isoformat()
+
+
+def _now_iso() -> str:
+    """Current local time as an ISO string, formatted once per second"""
+    return _iso_for_second(int(time.time()))
+
 
 def synthesize_liminal_connections(
     primary_market: Dict[str, Any],
@@ -24,7 +45,7 @@ def synthesize_liminal_connections(
     """
 
     synthesis_result = {
-        "synthesis_timestamp": datetime.now().isoformat(),
+        "synthesis_timestamp": _now_iso(),
         "breakthrough_opportunities": [],
         "connection_patterns": [],
         "arbitrage_discoveries": [],
@@ -49,7 +70,7 @@ def synthesize_liminal_connections(
         by synthesizing these market discoveries.
 
         SYNTHESIS DATA:
-        {json.dumps(synthesis_data, indent=2)[:3000]}
+        {json.dumps(synthesis_data, separators=(",", ":"), default=str)}
 
         MISSION: Find GENUINE LIMINAL OPPORTUNITIES that exist between established markets.
 
@@ -150,6 +171,34 @@ def synthesize_liminal_connections(
         return synthesis_result
 
 
+# Key fragments that route a market_data field into each signal category
+SIGNAL_KEYWORDS = (
+    ("pain_points", ("pain", "problem", "frustration", "issue")),
+    ("market_gaps", ("gap", "missing", "need", "lack")),
+    ("cost_inefficiencies", ("expensive", "cost", "price", "fee")),
+    ("workflow_breaks", ("manual", "switch", "break", "friction")),
+    ("underutilized_resources", ("unused", "idle", "underutilized", "spare")),
+)
+
+# Bounds on what each category contributes to the synthesis prompt
+SIGNALS_PER_CATEGORY = 3
+SIGNAL_MAX_CHARS = 300
+# Serialized size allowed per market input; the four inputs of a synthesis
+# together stay near the 3000 characters the prompt used to be sliced to
+SIGNAL_BUDGET_CHARS = 600
+
+
+def clip_signal(item: Any) -> Any:
+    """Shorten a signal for the synthesis prompt, keeping dicts and lists as-is"""
+    if isinstance(item, str):
+        return item[:SIGNAL_MAX_CHARS]
+    if isinstance(item, dict):
+        return {key: clip_signal(value) for key, value in item.items()}
+    if isinstance(item, list):
+        return [clip_signal(value) for value in item[:SIGNALS_PER_CATEGORY]]
+    return item
+
+
 def extract_key_signals(market_data: Dict[str, Any]) -> Dict[str, Any]:
     """Extract key signals from market data for synthesis"""
     if not market_data:
@@ -164,84 +213,136 @@ def extract_key_signals(market_data: Dict[str, Any]) -> Dict[str, Any]:
         "underutilized_resources": [],
     }
 
-    # Extract signals from various data structures
-    def extract_from_any(data, target_list, keywords):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if any(kw in key.lower() for kw in keywords):
+    budget = SIGNAL_BUDGET_CHARS
+
+    def add_signal(bucket: List[Any], item: Any):
+        """Add a clipped signal if it still fits in the character budget"""
+        nonlocal budget
+        clipped = clip_signal(item)
+        cost = len(json.dumps(clipped, separators=(",", ":"), default=str))
+        if cost <= budget:
+            bucket.append(clipped)
+            budget -= cost
+
+    # Walk the data once with an explicit stack, checking every category per key.
+    # Entries are pushed in reverse so they pop in the same depth-first order the
+    # old per-category recursion produced.
+    stack = [(None, market_data)]
+    while stack:
+        key, value = stack.pop()
+
+        if key is not None:
+            lkey = str(key).lower()
+            for category, keywords in SIGNAL_KEYWORDS:
+                bucket = signals[category]
+                if len(bucket) >= SIGNALS_PER_CATEGORY:
+                    continue
+                if any(kw in lkey for kw in keywords):
                     if isinstance(value, list):
-                        target_list.extend(value[:3])  # Limit for performance
+                        room = SIGNALS_PER_CATEGORY - len(bucket)
+                        for item in value[:room]:
+                            add_signal(bucket, item)
                     elif isinstance(value, str) and len(value) > 10:
-                        target_list.append(value)
-                extract_from_any(value, target_list, keywords)
-        elif isinstance(data, list):
-            for item in data[:5]:  # Limit list processing
-                extract_from_any(item, target_list, keywords)
-
-    # Extract different types of signals
-    extract_from_any(
-        market_data, signals["pain_points"], ["pain", "problem", "frustration", "issue"]
-    )
-    extract_from_any(
-        market_data, signals["market_gaps"], ["gap", "missing", "need", "lack"]
-    )
-    extract_from_any(
-        market_data,
-        signals["cost_inefficiencies"],
-        ["expensive", "cost", "price", "fee"],
-    )
-    extract_from_any(
-        market_data,
-        signals["workflow_breaks"],
-        ["manual", "switch", "break", "friction"],
-    )
-    extract_from_any(
-        market_data,
-        signals["underutilized_resources"],
-        ["unused", "idle", "underutilized", "spare"],
-    )
+                        add_signal(bucket, value)
+
+        if isinstance(value, dict):
+            stack.extend(reversed(value.items()))
+        elif isinstance(value, list):
+            # Limit list processing
+            stack.extend((None, item) for item in reversed(value[:5]))
 
     return signals
 
 
+# Keyword groups shared by the opportunity scorers and validators
+SIMPLE_MVP_WORDS = ("simple", "basic", "existing", "api")
+MODERATE_MVP_WORDS = ("moderate", "platform", "marketplace")
+COMPLEX_MVP_WORDS = ("complex", "advanced", "difficult")
+REGULATION_WORDS = ("regulated", "compliance", "legal")
+STRONG_ARBITRAGE_WORDS = ("significant", "massive", "huge", "clear")
+SOLID_ARBITRAGE_WORDS = ("good", "solid", "reasonable")
+TIMING_SIGNALS = (
+    "covid",
+    "remote",
+    "digital",
+    "mobile",
+    "ai",
+    "technology",
+    "behavior",
+    "trend",
+)
+MOAT_WORDS = ("data", "scale", "brand", "switching")
+SCALABLE_REVENUE_WORDS = ("commission", "subscription", "platform")
+USAGE_REVENUE_WORDS = ("transaction", "usage")
+
+# Keywords looked for anywhere in the opportunity text
+BLOB_KEYWORDS = REGULATION_WORDS + ("competitive", "marketplace")
+
+
+def find_blob_keywords(opportunity: Dict[str, Any]) -> set:
+    """Return the BLOB_KEYWORDS present in the opportunity's text"""
+    text = str(opportunity).lower()
+    return {word for word in BLOB_KEYWORDS if word in text}
+
+
 def enhance_opportunity_analysis(opportunity: Dict[str, Any]) -> Dict[str, Any]:
     """Enhance opportunity with deeper analysis"""
 
-    enhanced = opportunity.copy()
+    # Collect only the added fields and merge once on return
+    extras = {}
 
     try:
+        # Stringify the opportunity once for both keyword checks below
+        keywords = find_blob_keywords(opportunity)
+
         # Calculate opportunity score
-        enhanced["opportunity_score"] = calculate_opportunity_score(opportunity)
+        extras["opportunity_score"] = calculate_opportunity_score(opportunity)
 
         # Add implementation difficulty
-        enhanced["implementation_difficulty"] = assess_implementation_difficulty(
+        extras["implementation_difficulty"] = assess_implementation_difficulty(
             opportunity
         )
 
         # Add time to market
-        enhanced["time_to_market"] = estimate_time_to_market(opportunity)
+        extras["time_to_market"] = estimate_time_to_market(
+            extras["implementation_difficulty"]
+        )
 
         # Add risk factors
-        enhanced["risk_factors"] = identify_risk_factors(opportunity)
+        extras["risk_factors"] = identify_risk_factors(opportunity, keywords)
 
         # Add success indicators
-        enhanced["success_indicators"] = identify_success_indicators(opportunity)
-
-        return enhanced
+        extras["success_indicators"] = identify_success_indicators(
+            opportunity, keywords
+        )
 
     except Exception as e:
-        enhanced["enhancement_error"] = str(e)
-        return enhanced
+        extras["enhancement_error"] = str(e)
+
+    return opportunity | extras
 
 
 def calculate_opportunity_score(opportunity: Dict[str, Any]) -> float:
     """Calculate overall opportunity score (0-1)"""
 
+    return _score_opportunity_fields(
+        opportunity.get("market_size_estimate", "").lower(),
+        opportunity.get("value_arbitrage", "").lower(),
+        opportunity.get("why_now", "").lower(),
+        opportunity.get("network_effect", "").lower(),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_opportunity_fields(
+    market_size: str, arbitrage: str, timing: str, network: str
+) -> float:
+    """Score the lowercased opportunity fields; cached so re-scoring is free"""
+
     # score = 0.0
     factors = []
 
     # Market size factor
-    market_size = opportunity.get("market_size_estimate", "").lower()
     if "billion" in market_size:
         factors.append(0.9)
     elif "million" in market_size:
@@ -250,7 +351,6 @@ def calculate_opportunity_score(opportunity: Dict[str, Any]) -> float:
         factors.append(0.5)
 
     # Value arbitrage factor
-    arbitrage = opportunity.get("value_arbitrage", "").lower()
     if "high" in arbitrage or "significant" in arbitrage:
         factors.append(0.8)
     elif "medium" in arbitrage or "moderate" in arbitrage:
@@ -259,14 +359,12 @@ def calculate_opportunity_score(opportunity: Dict[str, Any]) -> float:
         factors.append(0.4)
 
     # Market timing factor
-    timing = opportunity.get("why_now", "").lower()
     if len(timing) > 100:  # Detailed timing explanation
         factors.append(0.8)
     else:
         factors.append(0.5)
 
     # Network effects factor
-    network = opportunity.get("network_effect", "").lower()
     if "strong" in network or "viral" in network:
         factors.append(0.9)
     elif "moderate" in network:
@@ -282,18 +380,16 @@ def assess_implementation_difficulty(opportunity: Dict[str, Any]) -> str:
 
     mvp = opportunity.get("implementation_mvp", "").lower()
 
-    if any(word in mvp for word in ["simple", "basic", "existing", "api"]):
+    if any(word in mvp for word in SIMPLE_MVP_WORDS):
         return "low"
-    elif any(word in mvp for word in ["moderate", "platform", "marketplace"]):
+    elif any(word in mvp for word in MODERATE_MVP_WORDS):
         return "medium"
     else:
         return "high"
 
 
-def estimate_time_to_market(opportunity: Dict[str, Any]) -> str:
-    """Estimate time to get to market"""
-
-    difficulty = assess_implementation_difficulty(opportunity)
+def estimate_time_to_market(difficulty: str) -> str:
+    """Estimate time to get to market from the implementation difficulty"""
 
     if difficulty == "low":
         return "3-6 months"
@@ -303,16 +399,17 @@ def estimate_time_to_market(opportunity: Dict[str, Any]) -> str:
         return "12+ months"
 
 
-def identify_risk_factors(opportunity: Dict[str, Any]) -> List[str]:
+def identify_risk_factors(
+    opportunity: Dict[str, Any], keywords: Optional[set] = None
+) -> List[str]:
     """Identify key risk factors"""
 
     risks = []
+    if keywords is None:
+        keywords = find_blob_keywords(opportunity)
 
     # Check for regulation risks
-    if any(
-        word in str(opportunity).lower()
-        for word in ["regulated", "compliance", "legal"]
-    ):
+    if keywords.intersection(REGULATION_WORDS):
         risks.append("Regulatory complexity")
 
     # Check for network effect dependency
@@ -320,7 +417,7 @@ def identify_risk_factors(opportunity: Dict[str, Any]) -> List[str]:
         risks.append("Chicken-and-egg problem (needs both sides)")
 
     # Check for competition
-    if "competitive" in str(opportunity).lower():
+    if "competitive" in keywords:
         risks.append("Competitive market entry")
 
     # Default risks
@@ -335,9 +432,14 @@ def identify_risk_factors(opportunity: Dict[str, Any]) -> List[str]:
     return risks[:5]
 
 
-def identify_success_indicators(opportunity: Dict[str, Any]) -> List[str]:
+def identify_success_indicators(
+    opportunity: Dict[str, Any], keywords: Optional[set] = None
+) -> List[str]:
     """Identify early success indicators to track"""
 
+    if keywords is None:
+        keywords = find_blob_keywords(opportunity)
+
     indicators = [
         "User sign-up rate",
         "Transaction volume growth",
@@ -346,7 +448,7 @@ def identify_success_indicators(opportunity: Dict[str, Any]) -> List[str]:
     ]
 
     # Add opportunity-specific indicators
-    if "marketplace" in str(opportunity).lower():
+    if "marketplace" in keywords:
         indicators.append("Supply-demand balance")
 
     if "subscription" in opportunity.get("revenue_model", "").lower():
@@ -364,7 +466,7 @@ def validate_connection_strength(
 
     validation = {
         "opportunity_name": opportunity.get("opportunity_name", "Unknown"),
-        "validation_timestamp": datetime.now().isoformat(),
+        "validation_timestamp": _now_iso(),
         "connection_strength": 0.0,
         "validation_factors": {},
         "go_no_go_recommendation": "analyze",
@@ -376,14 +478,14 @@ def validate_connection_strength(
         print(f"🔍 VALIDATING: {opportunity.get('opportunity_name', 'Unknown')}")
 
         # Core validation factors
-        factors = {
-            "market_size_viability": validate_market_size(opportunity),
-            "arbitrage_strength": validate_arbitrage(opportunity),
-            "technical_feasibility": validate_technical_feasibility(opportunity),
-            "market_timing": validate_market_timing(opportunity),
-            "competitive_advantage": validate_competitive_advantage(opportunity),
-            "scalability_potential": validate_scalability(opportunity),
-        }
+        factors = dict(
+            zip(
+                VALIDATION_FACTORS,
+                _validation_factor_scores(
+                    tuple(opportunity.get(field, "") for field in VALIDATION_FIELDS)
+                ),
+            )
+        )
 
         validation["validation_factors"] = factors
 
@@ -421,6 +523,43 @@ def validate_connection_strength(
         return validation
 
 
+# Opportunity fields the validators read, and the factor names they produce
+VALIDATION_FIELDS = (
+    "market_size_estimate",
+    "value_arbitrage",
+    "expensive_side",
+    "underutilized_side",
+    "implementation_mvp",
+    "why_now",
+    "competitive_moat",
+    "network_effect",
+    "revenue_model",
+)
+VALIDATION_FACTORS = (
+    "market_size_viability",
+    "arbitrage_strength",
+    "technical_feasibility",
+    "market_timing",
+    "competitive_advantage",
+    "scalability_potential",
+)
+
+
+@lru_cache(maxsize=4096)
+def _validation_factor_scores(field_values: tuple) -> tuple:
+    """Run every validator over the given field values; cached per unique opportunity"""
+
+    opportunity = dict(zip(VALIDATION_FIELDS, field_values))
+    return (
+        validate_market_size(opportunity),
+        validate_arbitrage(opportunity),
+        validate_technical_feasibility(opportunity),
+        validate_market_timing(opportunity),
+        validate_competitive_advantage(opportunity),
+        validate_scalability(opportunity),
+    )
+
+
 def validate_market_size(opportunity: Dict[str, Any]) -> float:
     """Validate market size is large enough"""
 
@@ -452,9 +591,9 @@ def validate_arbitrage(opportunity: Dict[str, Any]) -> float:
     score = 0.0
 
     # Check for clear arbitrage language
-    if any(word in arbitrage for word in ["significant", "massive", "huge", "clear"]):
+    if any(word in arbitrage for word in STRONG_ARBITRAGE_WORDS):
         score += 0.4
-    elif any(word in arbitrage for word in ["good", "solid", "reasonable"]):
+    elif any(word in arbitrage for word in SOLID_ARBITRAGE_WORDS):
         score += 0.3
     else:
         score += 0.1
@@ -473,11 +612,11 @@ def validate_technical_feasibility(opportunity: Dict[str, Any]) -> float:
 
     mvp = opportunity.get("implementation_mvp", "").lower()
 
-    if any(word in mvp for word in ["api", "existing", "simple", "basic"]):
+    if any(word in mvp for word in SIMPLE_MVP_WORDS):
         return 0.9
-    elif any(word in mvp for word in ["platform", "marketplace", "moderate"]):
+    elif any(word in mvp for word in MODERATE_MVP_WORDS):
         return 0.7
-    elif any(word in mvp for word in ["complex", "advanced", "difficult"]):
+    elif any(word in mvp for word in COMPLEX_MVP_WORDS):
         return 0.4
     else:
         return 0.6
@@ -491,18 +630,7 @@ def validate_market_timing(opportunity: Dict[str, Any]) -> float:
     score = 0.5  # Base score
 
     # Check for timing indicators
-    timing_signals = [
-        "covid",
-        "remote",
-        "digital",
-        "mobile",
-        "ai",
-        "technology",
-        "behavior",
-        "trend",
-    ]
-
-    signal_count = sum(1 for signal in timing_signals if signal in timing)
+    signal_count = sum(1 for signal in TIMING_SIGNALS if signal in timing)
     score += min(signal_count * 0.1, 0.4)
 
     # Check for detailed explanation
@@ -529,7 +657,7 @@ def validate_competitive_advantage(opportunity: Dict[str, Any]) -> float:
         score += 0.1
 
     # Other moats
-    if any(word in moat for word in ["data", "scale", "brand", "switching"]):
+    if any(word in moat for word in MOAT_WORDS):
         score += 0.3
     else:
         score += 0.2
@@ -546,11 +674,9 @@ def validate_scalability(opportunity: Dict[str, Any]) -> float:
     score = 0.5  # Base score
 
     # Revenue model scalability
-    if any(
-        word in revenue_model for word in ["commission", "subscription", "platform"]
-    ):
+    if any(word in revenue_model for word in SCALABLE_REVENUE_WORDS):
         score += 0.3
-    elif any(word in revenue_model for word in ["transaction", "usage"]):
+    elif any(word in revenue_model for word in USAGE_REVENUE_WORDS):
         score += 0.2
 
     # Network effects boost scalability
@@ -598,7 +724,7 @@ def rank_liminal_opportunities(opportunities: List[Dict[str, Any]]) -> Dict[str,
     """
 
     ranking = {
-        "ranking_timestamp": datetime.now().isoformat(),
+        "ranking_timestamp": _now_iso(),
         "total_opportunities": len(opportunities),
         "ranked_opportunities": [],
         "top_tier_opportunities": [],
@@ -616,36 +742,37 @@ def rank_liminal_opportunities(opportunities: List[Dict[str, Any]]) -> Dict[str,
     try:
         print(f"📊 RANKING {len(opportunities)} opportunities...")
 
-        # Score each opportunity
-        scored_opportunities = []
+        # Score each opportunity straight into its tier. Tiers are contiguous
+        # score bands, so sorting each bucket and concatenating them in tier
+        # order gives the full ranking without a separate filtering pass.
+        by_tier = {tier: [] for tier in TIER_ORDER}
 
         for opp in opportunities:
             # Calculate composite score
             composite_score = calculate_composite_opportunity_score(opp)
+            tier = classify_opportunity_tier(composite_score)
 
             ranked_opp = {
                 **opp,
                 "composite_score": composite_score,
-                "tier": classify_opportunity_tier(composite_score),
+                "tier": tier,
                 "investment_recommendation": generate_investment_recommendation(
                     composite_score
                 ),
             }
 
-            scored_opportunities.append(ranked_opp)
+            by_tier[tier].append(ranked_opp)
 
-        # Sort by composite score
-        scored_opportunities.sort(key=lambda x: x["composite_score"], reverse=True)
+        scored_opportunities = []
+        for tier in TIER_ORDER:
+            by_tier[tier].sort(key=lambda x: x["composite_score"], reverse=True)
+            scored_opportunities.extend(by_tier[tier])
 
         ranking["ranked_opportunities"] = scored_opportunities
 
         # Categorize opportunities
-        ranking["top_tier_opportunities"] = [
-            opp for opp in scored_opportunities if opp["tier"] == "top_tier"
-        ]
-        ranking["sleeper_opportunities"] = [
-            opp for opp in scored_opportunities if opp["tier"] == "sleeper"
-        ]
+        ranking["top_tier_opportunities"] = by_tier["top_tier"]
+        ranking["sleeper_opportunities"] = by_tier["sleeper"]
 
         print(
             f"✅ RANKING COMPLETE: {len(ranking['top_tier_opportunities'])} top-tier opportunities"
@@ -698,6 +825,10 @@ def calculate_composite_opportunity_score(opportunity: Dict[str, Any]) -> float:
     return composite
 
 
+# Tiers from highest to lowest score band, as assigned below
+TIER_ORDER = ("top_tier", "high_potential", "sleeper", "risky")
+
+
 def classify_opportunity_tier(score: float) -> str:
     """Classify opportunity into tiers"""
 
@@ -732,7 +863,7 @@ def execute_parallel_liminal_discovery(keywords: List[str]) -> Dict[str, Any]:
 
     discovery_results = {
         "keywords": keywords,
-        "discovery_timestamp": datetime.now().isoformat(),
+        "discovery_timestamp": _now_iso(),
         "parallel_execution": True,
         "results": {},
         "synthesis": {},
@@ -752,24 +883,36 @@ def execute_parallel_liminal_discovery(keywords: List[str]) -> Dict[str, Any]:
             ("workflow_gaps", discover_workflow_gaps_parallel),
         ]
 
-        # Execute all discovery tasks in parallel
+        # Submit every discovery task first, then wait once for all of them.
+        # These tasks only wait on searches in search_pool, so they get their
+        # own short-lived executor rather than competing for its workers.
         results = {}
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        executor = ThreadPoolExecutor(max_workers=4)
+        try:
             future_to_task = {
                 executor.submit(task_func, keywords): task_name
                 for task_name, task_func in discovery_tasks
             }
 
-            for future in as_completed(future_to_task):
+            done, not_done = wait(future_to_task, timeout=30)
+
+            for future in done:
                 task_name = future_to_task[future]
                 try:
-                    result = future.result(timeout=30)
-                    results[task_name] = result
+                    results[task_name] = future.result()
                     print(f"✅ {task_name} discovery completed")
                 except Exception as e:
                     print(f"❌ {task_name} discovery failed: {e}")
                     results[task_name] = {"error": str(e)}
 
+            for future in not_done:
+                task_name = future_to_task[future]
+                print(f"❌ {task_name} discovery timed out")
+                results[task_name] = {"error": "timed out"}
+        finally:
+            # Don't block on stragglers that already missed the deadline
+            executor.shutdown(wait=False, cancel_futures=True)
+
         discovery_results["results"] = results
 
         # Synthesize all results
@@ -830,20 +973,28 @@ def parallel_search_execution(
     }
 
     try:
-        # Execute searches in parallel
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [
-                executor.submit(tavily_quick_search, query, 2)
-                for query in search_queries[:6]  # Limit for performance
-            ]
+        # Submit all searches to the shared pool, then collect them with a
+        # single bounded wait
+        futures = [
+            search_pool.submit(tavily_quick_search, query, 2)
+            for query in search_queries[:6]  # Limit for performance
+        ]
 
-            for future in as_completed(futures):
-                try:
-                    search_result = future.result(timeout=10)
-                    if search_result and not search_result.get("error"):
-                        results["search_results"].append(search_result)
-                except Exception as e:
-                    print(f"Search failed: {e}")
+        done, not_done = wait(futures, timeout=10)
+
+        for future in done:
+            try:
+                search_result = future.result()
+                if search_result and not search_result.get("error"):
+                    results["search_results"].append(search_result)
+            except Exception as e:
+                print(f"Search failed: {e}")
+
+        if not_done:
+            print(f"{len(not_done)} searches timed out")
+            # Free the pool for other callers if they never started
+            for future in not_done:
+                future.cancel()
 
         # Process results to extract signals
         results["processed_signals"] = process_search_results_for_signals(
@@ -860,9 +1011,17 @@ def parallel_search_execution(
 def generate_search_queries(keywords: List[str], discovery_type: str) -> List[str]:
     """Generate targeted search queries based on discovery type"""
 
+    # Limit keywords for performance
+    return list(_search_queries_for(tuple(keywords[:2]), discovery_type))
+
+
+@lru_cache(maxsize=256)
+def _search_queries_for(keywords: tuple, discovery_type: str) -> tuple:
+    """Build the query tuple for a keyword set; cached across discovery runs"""
+
     queries = []
 
-    for keyword in keywords[:2]:  # Limit keywords for performance
+    for keyword in keywords:
         if discovery_type == "primary_market":
             queries.extend(
                 [
@@ -899,7 +1058,8 @@ def generate_search_queries(keywords: List[str], discovery_type: str) -> List[st
                 ]
             )
 
-    return queries
+    # Repeated keywords would otherwise issue the same search twice
+    return tuple(dict.fromkeys(queries))
 
 
 def process_search_results_for_signals(
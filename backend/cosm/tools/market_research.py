@@ -5,25 +5,138 @@ Updated to use threading instead of async
 """
 
 import json
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import re
+import socket
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from google.genai import Client
+from typing import Dict, List, Any, Optional, Tuple
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from statistics import median_high
+from cachetools import TTLCache
 from cosm.config import MODEL_CONFIG as CONFIG
 from cosm.settings import settings
 from cosm.discovery.explorer_agent import safe_json_loads
 from cosm.utils import robust_completion
 
-# Initialize Gemini client
-client = Client()
+
+def _report_timestamp() -> str:
+    """Full-precision ISO timestamp for research reports and validation ids"""
+    return datetime.now().isoformat()
+
 
 # Global thread pool executor
 executor = ThreadPoolExecutor(max_workers=8)
 
+# Searches and extractions are pure functions of their inputs and many queries
+# repeat across stages and runs, so keep their results for a day
+RESEARCH_CACHE_TTL = 24 * 60 * 60
+_search_cache = TTLCache(maxsize=1024, ttl=RESEARCH_CACHE_TTL)
+_extraction_cache = TTLCache(maxsize=1024, ttl=RESEARCH_CACHE_TTL)
+_cache_lock = threading.Lock()
+
+# Work currently being computed for each cache key, so concurrent callers
+# asking for the same search or extraction wait for one result
+_inflight: Dict[tuple, Future] = {}
+
+
+def cached_single_flight(cache: TTLCache, key: tuple, compute):
+    """
+    Return cache[key], computing it at most once at a time across threads.
+    Falsy results are handed to waiting callers but not cached; if compute
+    raises, the caller that ran it sees the error and the waiters get None.
+    """
+    flight_key = (id(cache), key)
+    with _cache_lock:
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        pending = _inflight.get(flight_key)
+        owner = pending is None
+        if owner:
+            pending = _inflight[flight_key] = Future()
+
+    if not owner:
+        return pending.result()
+
+    value = None
+    try:
+        value = compute()
+        return value
+    finally:
+        with _cache_lock:
+            if value:
+                cache[key] = value
+            _inflight.pop(flight_key, None)
+        pending.set_result(value)
+
+
+# Search query templates for each research stage, expanded per keyword by
+# build_search_tasks
+PAIN_QUERY_TEMPLATES = (
+    "{keyword} problems frustrating users",
+    "alternatives to {keyword} needed",
+    "{keyword} market gaps opportunities",
+)
+COMPETITION_QUERY_TEMPLATES = (
+    "{keyword} top companies market leaders",
+    "best {keyword} solutions software tools",
+    "{keyword} competitors comparison review",
+)
+DEMAND_QUERY_TEMPLATES = (
+    "{keyword} market size statistics 2025",
+    "{keyword} growing demand trends",
+    "how many people use {keyword}",
+    "{keyword} market research report",
+)
+TREND_QUERY_TEMPLATES = (
+    "{keyword} trends 2024 2025 future",
+    "{keyword} market growth predictions",
+    "{keyword} emerging technologies innovations",
+    "{keyword} industry outlook report",
+)
+MARKET_SIZE_QUERY_TEMPLATES = (
+    "{keyword} market size 2025 billion",
+    "{keyword} industry size statistics global",
+    "{keyword} TAM total addressable market",
+    "{keyword} market research report value",
+)
+COMPETITOR_QUERY_TEMPLATES = (
+    "{keyword} {solution_type} competitors top companies",
+    "best {keyword} {solution_type} alternatives market leaders",
+    "{keyword} {solution_type} pricing comparison review",
+    "{keyword} {solution_type} market share leaders",
+)
+DEMAND_SIGNAL_QUERY_TEMPLATES = (
+    "{keyword} search volume trends statistics",
+    "{keyword} job market demand hiring trends",
+    "{keyword} startup funding investment 2025",
+    "{keyword} patent applications innovation",
+    "{keyword} social media mentions discussions",
+)
+PAIN_VALIDATION_QUERY_TEMPLATES = (
+    '"{keyword}" problem frustration discussions',
+    '"{keyword}" solution need market demand',
+    '"{keyword}" reddit twitter complaints',
+)
+
+
+def build_search_tasks(
+    templates: tuple, keywords: List[str], **fields: str
+) -> List[tuple]:
+    """Expand query templates into (query, keyword) tasks, dropping repeats"""
+    tasks = {}
+    for keyword in keywords:
+        for template in templates:
+            query = template.format(keyword=keyword, **fields)
+            tasks.setdefault(query, (query, keyword))
+    return list(tasks.values())
+
 
 def comprehensive_market_research(
     keywords: List[str], target_audience: str = ""
@@ -39,7 +152,7 @@ def comprehensive_market_research(
         Comprehensive market research report
     """
     research_report = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _report_timestamp(),
         "keywords": keywords,
         "target_audience": target_audience,
         "market_signals": [],
@@ -73,13 +186,12 @@ def comprehensive_market_research(
                         {} if result_key.endswith("_analysis") else []
                     )
 
-        # Calculate opportunity score and insights in parallel
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            score_future = executor.submit(calculate_opportunity_score, research_report)
-            insights_future = executor.submit(generate_insights, research_report)
-
-            research_report["opportunity_score"] = score_future.result()
-            research_report["actionable_insights"] = insights_future.result()
+        # The score is a few dict lookups and insights is a single model call,
+        # so run them inline rather than through another thread pool
+        research_report["opportunity_score"] = calculate_opportunity_score(
+            research_report
+        )
+        research_report["actionable_insights"] = generate_insights(research_report)
 
         return research_report
 
@@ -94,16 +206,7 @@ def discover_market_signals(keywords: List[str]) -> List[Dict[str, Any]]:
     signals = []
 
     # Batch queries for parallel execution
-    tasks = []
-    for keyword in keywords[:2]:  # Reduced from 3 to 2 for speed
-        pain_queries = [
-            f"{keyword} problems frustrating users",
-            f"alternatives to {keyword} needed",
-            f"{keyword} market gaps opportunities",
-        ]
-
-        for query in pain_queries:
-            tasks.append((query, keyword))
+    tasks = build_search_tasks(PAIN_QUERY_TEMPLATES, keywords[:2])
 
     # Execute all searches in parallel
     with ThreadPoolExecutor(max_workers=6) as executor:
@@ -127,27 +230,10 @@ def discover_market_signals(keywords: List[str]) -> List[Dict[str, Any]]:
 
 
 def search_and_extract_signals(query: str, keyword: str) -> List[Dict[str, Any]]:
-    """Threaded search and signal extraction"""
+    """Search and extract pain signals from all results in one call"""
     try:
         search_results = search_web(query, max_results=2)
-        signals = []
-
-        # Process results in parallel
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = {
-                executor.submit(extract_pain_signals, result, keyword): result
-                for result in search_results
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result:
-                        signals.append(result)
-                except Exception as e:
-                    print(f"Error extracting pain signals: {e}")
-
-        return signals
+        return extract_pain_signals(search_results, keyword)
     except Exception as e:
         print(f"Error in search_and_extract_signals: {e}")
         return []
@@ -164,15 +250,7 @@ def analyze_competition(keywords: List[str]) -> Dict[str, Any]:
     }
 
     # Prepare all search tasks
-    search_tasks = []
-    for keyword in keywords[:2]:
-        comp_queries = [
-            f"{keyword} top companies market leaders",
-            f"best {keyword} solutions software tools",
-            f"{keyword} competitors comparison review",
-        ]
-        for query in comp_queries:
-            search_tasks.append((query, keyword))
+    search_tasks = build_search_tasks(COMPETITION_QUERY_TEMPLATES, keywords[:2])
 
     # Execute searches in parallel
     all_competitors = []
@@ -213,7 +291,6 @@ def search_and_extract_competitors(query: str, keyword: str) -> List[Dict[str, A
     try:
         search_results = search_web(query, max_results=3)
         competitors = extract_competitors(search_results, keyword)
-        time.sleep(0.5)  # Rate limiting
         return competitors
     except Exception as e:
         print(f"Error in search_and_extract_competitors: {e}")
@@ -231,16 +308,7 @@ def validate_demand(keywords: List[str], target_audience: str) -> Dict[str, Any]
     }
 
     # Prepare all demand search tasks
-    search_tasks = []
-    for keyword in keywords[:3]:
-        demand_queries = [
-            f"{keyword} market size statistics 2025",
-            f"{keyword} growing demand trends",
-            f"how many people use {keyword}",
-            f"{keyword} market research report",
-        ]
-        for query in demand_queries:
-            search_tasks.append((query, keyword))
+    search_tasks = build_search_tasks(DEMAND_QUERY_TEMPLATES, keywords[:3])
 
     # Execute searches in parallel
     with ThreadPoolExecutor(max_workers=8) as executor:
@@ -267,13 +335,29 @@ def search_and_extract_demand(query: str, keyword: str) -> List[Dict[str, Any]]:
     try:
         search_results = search_web(query, max_results=2)
         demand_indicators = extract_demand(search_results, keyword)
-        time.sleep(0.5)  # Rate limiting
         return demand_indicators
     except Exception as e:
         print(f"Error in search_and_extract_demand: {e}")
         return []
 
 
+# Words marking a free-text trend as positive; extend the alternation to add more
+POSITIVE_TREND_PATTERN = re.compile(r"growth|increase", re.IGNORECASE)
+TREND_DIRECTIONS = ("growing", "declining", "stable")
+
+
+def trend_indicator_direction(indicator: Any) -> str:
+    """Direction of one extracted trend, from its direction field when present"""
+    if isinstance(indicator, dict):
+        direction = str(indicator.get("direction", "")).lower()
+        if direction in TREND_DIRECTIONS:
+            return direction
+        text = str(indicator.get("trend", ""))
+    else:
+        text = str(indicator)
+    return "growing" if POSITIVE_TREND_PATTERN.search(text) else "stable"
+
+
 def analyze_trends(keywords: List[str]) -> Dict[str, Any]:
     """Analyzes real market trends using threading"""
     trend_data = {
@@ -285,16 +369,7 @@ def analyze_trends(keywords: List[str]) -> Dict[str, Any]:
     }
 
     # Prepare all trend search tasks
-    search_tasks = []
-    for keyword in keywords[:2]:
-        trend_queries = [
-            f"{keyword} trends 2024 2025 future",
-            f"{keyword} market growth predictions",
-            f"{keyword} emerging technologies innovations",
-            f"{keyword} industry outlook report",
-        ]
-        for query in trend_queries:
-            search_tasks.append((query, keyword))
+    search_tasks = build_search_tasks(TREND_QUERY_TEMPLATES, keywords[:2])
 
     # Execute searches in parallel
     with ThreadPoolExecutor(max_workers=6) as executor:
@@ -311,16 +386,15 @@ def analyze_trends(keywords: List[str]) -> Dict[str, Any]:
                 print(f"Error analyzing trends: {e}")
 
     # Determine overall trend direction
-    positive_indicators = len(
-        [
-            t
-            for t in trend_data["growth_indicators"]
-            if "growth" in str(t).lower() or "increase" in str(t).lower()
-        ]
-    )
-    if positive_indicators > len(trend_data["growth_indicators"]) * 0.6:
+    directions = [trend_indicator_direction(t) for t in trend_data["growth_indicators"]]
+    positive_indicators = directions.count("growing")
+    negative_indicators = directions.count("declining")
+    if positive_indicators > len(directions) * 0.6:
         trend_data["trend_direction"] = "growing"
-    elif positive_indicators < len(trend_data["growth_indicators"]) * 0.3:
+    elif (
+        negative_indicators > positive_indicators
+        and positive_indicators < len(directions) * 0.3
+    ):
         trend_data["trend_direction"] = "declining"
 
     return trend_data
@@ -331,42 +405,138 @@ def search_and_extract_trends(query: str, keyword: str) -> List[Dict[str, Any]]:
     try:
         search_results = search_web(query, max_results=2)
         trends = extract_trends(search_results, keyword)
-        time.sleep(0.5)  # Rate limiting
         return trends
     except Exception as e:
         print(f"Error in search_and_extract_trends: {e}")
         return []
 
 
+SEARCH_URL = "https://html.duckduckgo.com/html/"
+
+# One keep-alive session shared by all search threads, so repeated searches
+# reuse pooled connections instead of opening a new TCP+TLS connection each
+http_session = requests.Session()
+http_session.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+)
+
+# Result links on the DuckDuckGo HTML page: captures (url, title)
+SEARCH_RESULT_PATTERN = re.compile(r'href="([^"]*)" class="result__a"[^>]*>([^<]*)</a>')
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
 def search_web(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     """Web search using requests instead of aiohttp"""
-    results = []
+    cache_key = (WHITESPACE_PATTERN.sub(" ", query.lower()).strip(), max_results)
+    # Empty results are usually failures or throttling, so they are not cached
+    results = cached_single_flight(
+        _search_cache, cache_key, lambda: fetch_search_results(query, max_results)
+    )
+    return [dict(result) for result in results or []]
 
-    try:
-        search_url = f"https://html.duckduckgo.com/html/?q={query}"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-        }
 
-        response = requests.get(search_url, headers=headers, timeout=10)
+class RateLimiter:
+    """
+    Thread-safe token bucket shared by every search thread. Allows short
+    bursts up to the bucket size while holding the average request rate.
+    """
 
-        if response.status_code == 200:
-            content = response.text
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
 
-            # Parse results (simplified for performance)
-            url_pattern = r'href="([^"]*)" class="result__a"[^>]*>([^<]*)</a>'
-            matches = re.findall(url_pattern, content)
 
-            for url, title in matches[:max_results]:
-                if url and title:
-                    results.append(
-                        {
-                            "title": title.strip(),
-                            "url": url,
-                            "snippet": "",  # Skip snippet extraction for speed
-                            "source": "web_search",
-                        }
-                    )
+# Caps outgoing searches across all research stages; cache hits are not throttled
+search_rate_limiter = RateLimiter(rate=4, burst=4)
+
+
+class RateLimitedRetry(Retry):
+    """
+    urllib3 retries happen inside the adapter, below fetch_search_results, so
+    each retried attempt takes its own search_rate_limiter token here.
+    """
+
+    def increment(self, *args, **kwargs):
+        retry = super().increment(*args, **kwargs)
+        search_rate_limiter.acquire()
+        return retry
+
+
+# Throttling and transient server errors are retried with backoff (honouring
+# Retry-After); the final response is returned so the status check handles it
+SEARCH_RETRY = RateLimitedRetry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+http_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=SEARCH_RETRY),
+)
+
+# Result pages are tens of KB; anything past this is not worth downloading
+MAX_RESPONSE_BYTES = 512 * 1024
+
+
+def read_capped_text(response: requests.Response) -> str:
+    """Read a streamed response body, stopping at MAX_RESPONSE_BYTES"""
+    body = bytearray()
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        body += chunk
+        if len(body) >= MAX_RESPONSE_BYTES:
+            break
+    return body[:MAX_RESPONSE_BYTES].decode(
+        response.encoding or "utf-8", errors="ignore"
+    )
+
+
+def fetch_search_results(query: str, max_results: int) -> List[Dict[str, str]]:
+    """Run one DuckDuckGo search and parse the result links"""
+    results = []
+
+    try:
+        search_rate_limiter.acquire()
+        with http_session.get(
+            SEARCH_URL, params={"q": query}, timeout=10, stream=True
+        ) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if response.status_code != 200 or "text/html" not in content_type:
+                return results
+            content = read_capped_text(response)
+
+        # Parse results (simplified for performance)
+        matches = SEARCH_RESULT_PATTERN.findall(content)
+
+        for url, title in matches[:max_results]:
+            if url and title:
+                results.append(
+                    {
+                        "title": WHITESPACE_PATTERN.sub(" ", title).strip(),
+                        "url": url,
+                        "snippet": "",  # Skip snippet extraction for speed
+                        "source": "web_search",
+                    }
+                )
 
     except Exception as e:
         print(f"Error in web search: {e}")
@@ -374,215 +544,258 @@ def search_web(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     return results
 
 
-def extract_pain_signals(
-    search_result: Dict[str, str], keyword: str
-) -> Optional[Dict[str, Any]]:
-    """Uses Gemini to extract pain signals from search results"""
-    try:
-        prompt = f"""
-        Analyze this search result about "{keyword}" and extract any pain points, problems, or market gaps mentioned.
+# Extraction quality flattens out well before this many snippet characters
+SNIPPET_PROMPT_CHARS = 300
 
-        Title: {search_result.get('title', '')}
-        Content: {search_result.get('snippet', '')}
 
-        Extract and return a JSON object with:
-        - pain_point: The specific problem mentioned
-        - severity: How severe the problem seems (high/medium/low)
-        - frequency: How often this problem occurs (high/medium/low)
-        - target_users: Who is affected by this problem
-        - opportunity: What business opportunity this represents
+def format_search_results(search_results: List[Dict[str, str]]) -> str:
+    """Render search results as a numbered block for a single extraction prompt"""
+    return "\n\n".join(
+        f"[{idx}] Title: {result.get('title', '')}\n"
+        f"Content: {result.get('snippet', '')[:SNIPPET_PROMPT_CHARS]}"
+        for idx, result in enumerate(search_results, 1)
+    )
+
+
+def search_results_prompt(search_results: List[Dict[str, str]], keyword: str) -> str:
+    """User message carrying only the dynamic part of an extraction request"""
+    results = format_search_results(search_results)
+    return f'Search results about "{keyword}":\n\n{results}'
+
+
+def extraction_completion(instructions: str, prompt: str) -> Optional[str]:
+    """Run an extraction prompt, reusing the answer for a prompt seen before"""
+    cache_key = (
+        hashlib.sha256(instructions.encode()).hexdigest(),
+        hashlib.sha256(prompt.encode()).hexdigest(),
+    )
+    return cached_single_flight(
+        _extraction_cache,
+        cache_key,
+        lambda: run_extraction_prompt(instructions, prompt),
+    )
+
+
+def run_extraction_prompt(instructions: str, prompt: str) -> Optional[str]:
+    """
+    Send an extraction prompt and return the raw JSON text. The fixed
+    instructions go in the system message so every call shares the same
+    prompt prefix and only the search results vary.
+    """
+    return json_completion(
+        [
+            {"role": "system", "content": instructions},
+            {"role": "user", "content": prompt},
+        ],
+        ANALYSIS_TEMPERATURE,
+    )
+
+
+# Completion settings shared by every model call in this module
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+ANALYSIS_TEMPERATURE = 0.3  # extraction and risk analysis
+CREATIVE_TEMPERATURE = 0.4  # insights and recommendations
 
-        Only return the JSON object, no other text.
-        """
 
-        response = robust_completion(
-            model=CONFIG["market_research"],
-            api_key=settings.OPENAI_API_KEY,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=0.3,
+def json_completion(
+    messages: List[Dict[str, str]], temperature: float
+) -> Optional[str]:
+    """Run a JSON-mode completion on the market research model, returning its text"""
+    response = robust_completion(
+        model=CONFIG["market_research"],
+        api_key=settings.OPENAI_API_KEY,
+        messages=messages,
+        response_format=JSON_RESPONSE_FORMAT,
+        temperature=temperature,
+    )
+
+    return response.choices[0].message.content if response else None
+
+
+def prompt_json(data: Any) -> str:
+    """Serialize data for embedding in a prompt without indentation whitespace"""
+    return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def parse_extracted_items(content: str, key: str) -> List[Dict[str, Any]]:
+    """Pull the list stored under key out of a JSON object completion"""
+    data = safe_json_loads(content)
+    if isinstance(data, list):
+        return data
+    items = data.get(key) if isinstance(data, dict) else None
+    return items if isinstance(items, list) else []
+
+
+PAIN_SIGNALS_PROMPT = """Extract any pain points, problems, or market gaps mentioned in the numbered search results.
+
+Return a JSON object with a "pain_signals" array, each with:
+- result: The number of the search result it came from
+- pain_point: The specific problem mentioned
+- severity: How severe the problem seems (high/medium/low)
+- frequency: How often this problem occurs (high/medium/low)
+- target_users: Who is affected by this problem
+- opportunity: What business opportunity this represents
+
+Only return the JSON object, no other text."""
+
+
+def extract_pain_signals(
+    search_results: List[Dict[str, str]], keyword: str
+) -> List[Dict[str, Any]]:
+    """Uses Gemini to extract pain signals from a batch of search results"""
+    if not search_results:
+        return []
+
+    try:
+        content = extraction_completion(
+            PAIN_SIGNALS_PROMPT, search_results_prompt(search_results, keyword)
         )
 
-        if response and response.choices[0].message.content:
-            pain_signal = safe_json_loads(response.choices[0].message.content)
-            pain_signal["source"] = search_result.get("url", "")
-            pain_signal["keyword"] = keyword
-            return pain_signal
+        if content:
+            pain_signals = parse_extracted_items(content, "pain_signals")
+            for pain_signal in pain_signals:
+                index = pain_signal.pop("result", None)
+                source = (
+                    search_results[index - 1]
+                    if isinstance(index, int) and 0 < index <= len(search_results)
+                    else {}
+                )
+                pain_signal["source"] = source.get("url", "")
+                pain_signal["keyword"] = keyword
+            return pain_signals
 
     except Exception as e:
         print(f"Error extracting pain signals: {e}")
 
-    return None
+    return []
+
+
+COMPETITORS_PROMPT = """Extract any companies, products, or services mentioned as competitors or solutions in the numbered search results.
+
+Return a JSON object with a "competitors" array, each with:
+- name: Company/product name
+- type: Type of solution (software, service, platform, etc.)
+- market_position: Position in market (leader, challenger, niche, etc.)
+- strengths: Key strengths mentioned
+- weaknesses: Any weaknesses or limitations mentioned
+
+Only return the JSON object, no other text."""
 
 
 def extract_competitors(
     search_results: List[Dict[str, str]], keyword: str
 ) -> List[Dict[str, Any]]:
-    """Uses Gemini to extract competitor information"""
-    competitors = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result about "{keyword}" and extract any companies, products, or services mentioned as competitors or solutions.
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of competitors, each with:
-            - name: Company/product name
-            - type: Type of solution (software, service, platform, etc.)
-            - market_position: Position in market (leader, challenger, niche, etc.)
-            - strengths: Key strengths mentioned
-            - weaknesses: Any weaknesses or limitations mentioned
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Uses Gemini to extract competitor information from a batch of results"""
+    if not search_results:
+        return []
 
-            if response and response.choices[0].message.content:
-                result_competitors = safe_json_loads(
-                    response.choices[0].message.content
-                )
-                competitors.extend(result_competitors)
+    try:
+        content = extraction_completion(
+            COMPETITORS_PROMPT, search_results_prompt(search_results, keyword)
+        )
+
+        if content:
+            return parse_extracted_items(content, "competitors")
+
+    except Exception as e:
+        print(f"Error extracting competitors: {e}")
+
+    return []
 
-        except Exception as e:
-            print(f"Error extracting competitors: {e}")
-            continue
 
-    return competitors
+DEMAND_INDICATORS_PROMPT = """Extract any demand indicators, market size data, or usage statistics from the numbered search results.
+
+Return a JSON object with a "demand_indicators" array, each with:
+- metric: The specific metric or statistic
+- value: The numerical value if available
+- timeframe: Time period this applies to
+- source_credibility: How credible this source seems (high/medium/low)
+- growth_direction: Whether this indicates growth, decline, or stability
+
+Only return the JSON object, no other text."""
 
 
 def extract_demand(
     search_results: List[Dict[str, str]], keyword: str
 ) -> List[Dict[str, Any]]:
-    """Uses Gemini to extract demand indicators"""
-    demand_indicators = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result about "{keyword}" and extract any demand indicators, market size data, or usage statistics.
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of demand indicators, each with:
-            - metric: The specific metric or statistic
-            - value: The numerical value if available
-            - timeframe: Time period this applies to
-            - source_credibility: How credible this source seems (high/medium/low)
-            - growth_direction: Whether this indicates growth, decline, or stability
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Uses Gemini to extract demand indicators from a batch of results"""
+    if not search_results:
+        return []
+
+    try:
+        content = extraction_completion(
+            DEMAND_INDICATORS_PROMPT, search_results_prompt(search_results, keyword)
+        )
 
-            if response and response.choices[0].message.content:
-                indicators = safe_json_loads(response.choices[0].message.content)
-                demand_indicators.extend(indicators)
+        if content:
+            return parse_extracted_items(content, "demand_indicators")
 
-        except Exception as e:
-            print(f"Error extracting demand indicators: {e}")
-            continue
+    except Exception as e:
+        print(f"Error extracting demand indicators: {e}")
+
+    return []
+
+
+TRENDS_PROMPT = """Extract any trend information, future predictions, or market direction indicators from the numbered search results.
+
+Return a JSON object with a "trends" array, each with:
+- trend: Description of the trend
+- direction: growing/declining/stable
+- timeframe: When this trend is expected
+- impact: Potential impact on the market
+- confidence: How confident this prediction seems (high/medium/low)
 
-    return demand_indicators
+Only return the JSON object, no other text."""
 
 
 def extract_trends(
     search_results: List[Dict[str, str]], keyword: str
 ) -> List[Dict[str, Any]]:
-    """Uses Gemini to extract trend information"""
-    trends = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result about "{keyword}" and extract any trend information, future predictions, or market direction indicators.
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of trends, each with:
-            - trend: Description of the trend
-            - direction: growing/declining/stable
-            - timeframe: When this trend is expected
-            - impact: Potential impact on the market
-            - confidence: How confident this prediction seems (high/medium/low)
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Uses Gemini to extract trend information from a batch of results"""
+    if not search_results:
+        return []
+
+    try:
+        content = extraction_completion(
+            TRENDS_PROMPT, search_results_prompt(search_results, keyword)
+        )
 
-            if response and response.choices[0].message.content:
-                trend_data = safe_json_loads(response.choices[0].message.content)
-                trends.extend(trend_data)
+        if content:
+            return parse_extracted_items(content, "trends")
 
-        except Exception as e:
-            print(f"Error extracting trends: {e}")
-            continue
+    except Exception as e:
+        print(f"Error extracting trends: {e}")
+
+    return []
 
-    return trends
+
+# Opportunity score contributions; unknown levels get the lowest weight
+COMPETITION_LEVEL_SCORES = {"low": 0.25, "medium": 0.15}
+TREND_DIRECTION_SCORES = {"growing": 0.2, "stable": 0.1}
 
 
 def calculate_opportunity_score(research_data: Dict[str, Any]) -> float:
     """Calculates opportunity score based on real data"""
-    score = 0.0
+    pain_signals = research_data.get("market_signals") or []
+    competition = research_data.get("competition_analysis") or {}
+    demand = research_data.get("demand_validation") or {}
+    trends = research_data.get("trend_analysis") or {}
 
     # Pain signals score (0-0.3)
-    pain_signals = research_data.get("market_signals", [])
-    high_severity_signals = len(
-        [s for s in pain_signals if s.get("severity") == "high"]
-    )
-    pain_score = min(high_severity_signals * 0.1, 0.3)
-    score += pain_score
+    high_severity_signals = sum(1 for s in pain_signals if s.get("severity") == "high")
+    score = min(high_severity_signals * 0.1, 0.3)
 
     # Competition score (0-0.25) - lower competition = higher score
-    competition_level = research_data.get("competition_analysis", {}).get(
-        "competition_level", "high"
-    )
-    if competition_level == "low":
-        score += 0.25
-    elif competition_level == "medium":
-        score += 0.15
-    else:
-        score += 0.05
+    competition_level = competition.get("competition_level", "high")
+    score += COMPETITION_LEVEL_SCORES.get(competition_level, 0.05)
 
     # Demand score (0-0.25)
-    demand_score = research_data.get("demand_validation", {}).get("demand_score", 0.0)
+    demand_score = demand.get("demand_score", 0.0)
     score += min(demand_score * 0.25, 0.25)
 
     # Trend score (0-0.2)
-    trend_direction = research_data.get("trend_analysis", {}).get(
-        "trend_direction", "stable"
-    )
-    if trend_direction == "growing":
-        score += 0.2
-    elif trend_direction == "stable":
-        score += 0.1
-    else:
-        score += 0.05
+    trend_direction = trends.get("trend_direction", "stable")
+    score += TREND_DIRECTION_SCORES.get(trend_direction, 0.05)
 
     return min(score, 1.0)
 
@@ -593,46 +806,84 @@ def calculate_demand_score(demand_data: Dict[str, Any]) -> float:
     if not indicators:
         return 0.0
 
-    # Score based on number and quality of indicators
-    high_credibility = len(
-        [i for i in indicators if i.get("source_credibility") == "high"]
-    )
-    growth_indicators = len(
-        [i for i in indicators if i.get("growth_direction") == "growth"]
-    )
+    # Score based on number and quality of indicators, counted in one pass
+    high_credibility = 0
+    growth_indicators = 0
+    for indicator in indicators:
+        high_credibility += indicator.get("source_credibility") == "high"
+        growth_indicators += indicator.get("growth_direction") == "growth"
 
     score = (high_credibility * 0.3 + growth_indicators * 0.4) / max(len(indicators), 1)
     return min(score, 1.0)
 
 
-def generate_insights(research_data: Dict[str, Any]) -> List[str]:
-    """Generates actionable insights using Gemini"""
-    try:
-        prompt = f"""
-        Based on this market research data, generate 5-7 specific, actionable business insights and opportunities.
+INSIGHTS_PROMPT = """Based on this market research data, generate 5-7 specific, actionable business insights and opportunities.
 
-        Research Data: {json.dumps(research_data, indent=2)}
+Research Data: {research_data}
 
-        Focus on:
-        1. Specific market gaps that could be filled
-        2. Underserved customer segments
-        3. Technology opportunities
-        4. Business model innovations
-        5. Go-to-market strategies
+Focus on:
+1. Specific market gaps that could be filled
+2. Underserved customer segments
+3. Technology opportunities
+4. Business model innovations
+5. Go-to-market strategies
+
+Return a JSON object with an "insights" array, each insight a string that is specific, actionable, and based on the data."""
+
+# Items kept per list when the research report is summarized for the insights prompt
+INSIGHT_ITEMS_PER_SECTION = 10
+
+
+def insights_payload(research_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Trim the research report to the fields the insights prompt draws on"""
+    competition = research_data.get("competition_analysis") or {}
+    demand = research_data.get("demand_validation") or {}
+    trends = research_data.get("trend_analysis") or {}
+
+    return {
+        "keywords": research_data.get("keywords", []),
+        "target_audience": research_data.get("target_audience", ""),
+        "opportunity_score": research_data.get("opportunity_score", 0.0),
+        "market_signals": research_data.get("market_signals", [])[
+            :INSIGHT_ITEMS_PER_SECTION
+        ],
+        "competition": {
+            "competition_level": competition.get("competition_level"),
+            "direct_competitors": competition.get("direct_competitors", [])[
+                :INSIGHT_ITEMS_PER_SECTION
+            ],
+            "market_gaps": competition.get("market_gaps", []),
+        },
+        "demand": {
+            "demand_score": demand.get("demand_score"),
+            "indicators": demand.get("search_volume_indicators", [])[
+                :INSIGHT_ITEMS_PER_SECTION
+            ],
+        },
+        "trends": {
+            "trend_direction": trends.get("trend_direction"),
+            "growth_indicators": trends.get("growth_indicators", [])[
+                :INSIGHT_ITEMS_PER_SECTION
+            ],
+        },
+    }
 
-        Return a JSON array of insights, each as a string that is specific, actionable, and based on the data.
-        """
 
-        response = robust_completion(
-            model=CONFIG["market_research"],
-            api_key=settings.OPENAI_API_KEY,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=0.4,
+def generate_insights(research_data: Dict[str, Any]) -> List[str]:
+    """Generates actionable insights using Gemini"""
+    try:
+        prompt = INSIGHTS_PROMPT.format_map(
+            {"research_data": prompt_json(insights_payload(research_data))}
         )
 
-        if response and response.choices[0].message.content:
-            return safe_json_loads(response.choices[0].message.content)
+        content = json_completion(
+            [{"role": "user", "content": prompt}], CREATIVE_TEMPERATURE
+        )
+
+        if content:
+            insights = parse_extracted_items(content, "insights")
+            if insights:
+                return insights
 
     except Exception as e:
         print(f"Error generating insights: {e}")
@@ -649,30 +900,54 @@ def analyze_competitive_landscape(
     return analyze_competition(keywords)
 
 
+# DNS answers rarely change within a session, so remember them for an hour
+_dns_cache = TTLCache(maxsize=512, ttl=60 * 60)
+
+
+def domain_resolves(domain_name: str) -> bool:
+    """
+    Whether the domain currently resolves. Definitive answers (resolves, or
+    the name does not exist) are cached per lowercased name.
+    """
+    cache_key = domain_name.lower()
+    with _cache_lock:
+        cached = _dns_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        socket.gethostbyname(cache_key)
+        resolves = True
+    except socket.gaierror as e:
+        if e.errno != socket.EAI_NONAME:
+            # Transient resolver failure (e.g. EAI_AGAIN): answer, but retry next time
+            return False
+        resolves = False
+
+    with _cache_lock:
+        _dns_cache[cache_key] = resolves
+    return resolves
+
+
 def check_domain_availability(domain_name: str) -> Dict[str, Any]:
     """
     Checks domain availability for potential business names
 
     This supposes only domains in use are not available :(, something better needs to be implemented
     """
-    try:
-        # Simple domain availability check using whois
-        import socket
+    checked_at = _report_timestamp()
 
+    try:
         print(f"Checking domain availability for: {domain_name}")
         result = {
             "domain": domain_name,
             "available": False,
             "alternatives": [],
-            "checked_at": datetime.now().isoformat(),
+            "checked_at": checked_at,
         }
 
         # Try to resolve the domain
-        try:
-            socket.gethostbyname(domain_name)
-            result["available"] = False
-        except socket.gaierror:
-            result["available"] = True
+        result["available"] = not domain_resolves(domain_name)
 
         # Generate alternatives if not available
         if not result["available"]:
@@ -693,7 +968,7 @@ def check_domain_availability(domain_name: str) -> Dict[str, Any]:
             "domain": domain_name,
             "available": False,
             "error": str(e),
-            "checked_at": datetime.now().isoformat(),
+            "checked_at": checked_at,
         }
 
 
@@ -716,7 +991,7 @@ def analyze_market_size(
     market_size_data = {
         "keywords": keywords,
         "target_audience": target_audience,
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": _report_timestamp(),
         "tam_estimate": 0,  # Total Addressable Market
         "sam_estimate": 0,  # Serviceable Addressable Market
         "som_estimate": 0,  # Serviceable Obtainable Market
@@ -729,17 +1004,8 @@ def analyze_market_size(
     }
 
     try:
-        # Prepare all market size search tasks
-        search_tasks = []
-        for keyword in keywords[:3]:  # Limit to prevent rate limiting
-            market_queries = [
-                f"{keyword} market size 2025 billion",
-                f"{keyword} industry size statistics global",
-                f"{keyword} TAM total addressable market",
-                f"{keyword} market research report value",
-            ]
-            for query in market_queries:
-                search_tasks.append((query, keyword))
+        # Prepare all market size search tasks (limited to prevent rate limiting)
+        search_tasks = build_search_tasks(MARKET_SIZE_QUERY_TEMPLATES, keywords[:3])
 
         # Execute searches in parallel
         market_data_points = []
@@ -796,7 +1062,6 @@ def search_and_extract_market_size(query: str, keyword: str) -> List[Dict[str, A
     try:
         search_results = search_web(query, max_results=3)
         size_data = extract_market_size(search_results, keyword)
-        time.sleep(0.5)  # Rate limiting
         return size_data
     except Exception as e:
         print(f"Error in search_and_extract_market_size: {e}")
@@ -819,7 +1084,7 @@ def research_competition(
     competition_data = {
         "keywords": keywords,
         "solution_type": solution_type,
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": _report_timestamp(),
         "direct_competitors": [],
         "indirect_competitors": [],
         "market_leaders": [],
@@ -835,16 +1100,9 @@ def research_competition(
 
     try:
         # Prepare all competitor search tasks
-        search_tasks = []
-        for keyword in keywords[:2]:
-            competitor_queries = [
-                f"{keyword} {solution_type} competitors top companies",
-                f"best {keyword} {solution_type} alternatives market leaders",
-                f"{keyword} {solution_type} pricing comparison review",
-                f"{keyword} {solution_type} market share leaders",
-            ]
-            for query in competitor_queries:
-                search_tasks.append((query, keyword))
+        search_tasks = build_search_tasks(
+            COMPETITOR_QUERY_TEMPLATES, keywords[:2], solution_type=solution_type
+        )
 
         # Execute searches in parallel
         all_competitors = []
@@ -914,7 +1172,7 @@ def validate_demand_signals(
     demand_data = {
         "keywords": keywords,
         "pain_points": pain_points,
-        "validation_timestamp": datetime.now().isoformat(),
+        "validation_timestamp": _report_timestamp(),
         "signal_strength": 0.0,  # 0-100 scale
         "search_volume": 0,
         "social_mentions": 0,
@@ -929,30 +1187,18 @@ def validate_demand_signals(
     }
 
     try:
-        # Prepare all demand validation search tasks
-        search_tasks = []
-
-        # Validate demand through multiple signals
-        for keyword in keywords[:3]:
-            demand_queries = [
-                f"{keyword} search volume trends statistics",
-                f"{keyword} job market demand hiring trends",
-                f"{keyword} startup funding investment 2025",
-                f"{keyword} patent applications innovation",
-                f"{keyword} social media mentions discussions",
-            ]
-            for query in demand_queries:
-                search_tasks.append(("demand", query, keyword))
-
-        # Validate pain points specifically
-        for pain_point in pain_points[:3]:
-            pain_queries = [
-                f'"{pain_point}" problem frustration discussions',
-                f'"{pain_point}" solution need market demand',
-                f'"{pain_point}" reddit twitter complaints',
-            ]
-            for query in pain_queries:
-                search_tasks.append(("pain", query, pain_point))
+        # Validate demand through multiple signals, then pain points specifically
+        search_tasks = [
+            ("demand", query, keyword)
+            for query, keyword in build_search_tasks(
+                DEMAND_SIGNAL_QUERY_TEMPLATES, keywords[:3]
+            )
+        ] + [
+            ("pain", query, pain_point)
+            for query, pain_point in build_search_tasks(
+                PAIN_VALIDATION_QUERY_TEMPLATES, pain_points[:3]
+            )
+        ]
 
         # Execute all searches in parallel
         with ThreadPoolExecutor(max_workers=10) as executor:
@@ -1005,143 +1251,162 @@ def search_and_extract_demand_validation(
         else:  # pain validation
             validation_data = extract_pain_validation(search_results, keyword)
 
-        time.sleep(0.5)  # Rate limiting
         return validation_data
     except Exception as e:
         print(f"Error in search_and_extract_demand_validation: {e}")
         return []
 
 
+MARKET_SIZE_PROMPT = """Extract any market size data, statistics, or valuations from the numbered search results.
+
+Return a JSON object with a "market_size_data" array, each with:
+- market_size_value: The numerical value (e.g., "5.2 billion", "150M")
+- market_size_unit: The unit (billion, million, USD, etc.)
+- timeframe: Year or period this applies to
+- geographic_scope: Geographic area (global, US, Europe, etc.)
+- market_segment: Specific segment if mentioned
+- source_credibility: How credible this source seems (high/medium/low)
+
+Only return the JSON object, no other text."""
+
+
 def extract_market_size(
     search_results: List[Dict[str, str]], keyword: str
 ) -> List[Dict[str, Any]]:
-    """Extract market size data using Gemini"""
-    market_data = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result about "{keyword}" market size and extract any market size data, statistics, or valuations.
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of market size data points, each with:
-            - market_size_value: The numerical value (e.g., "5.2 billion", "150M")
-            - market_size_unit: The unit (billion, million, USD, etc.)
-            - timeframe: Year or period this applies to
-            - geographic_scope: Geographic area (global, US, Europe, etc.)
-            - market_segment: Specific segment if mentioned
-            - source_credibility: How credible this source seems (high/medium/low)
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Extract market size data from a batch of results using Gemini"""
+    if not search_results:
+        return []
 
-            if response and response.choices[0].message.content:
-                data_points = safe_json_loads(response.choices[0].message.content)
-                market_data.extend(data_points)
+    try:
+        content = extraction_completion(
+            MARKET_SIZE_PROMPT,
+            search_results_prompt(search_results, f"{keyword} market size"),
+        )
 
-        except Exception as e:
-            print(f"Error extracting market size data: {e}")
-            continue
+        if content:
+            return parse_extracted_items(content, "market_size_data")
+
+    except Exception as e:
+        print(f"Error extracting market size data: {e}")
+
+    return []
+
+
+DEMAND_SIGNALS_PROMPT = """Extract any demand indicators, market signals, or growth metrics from the numbered search results.
+
+Return a JSON object with a "demand_signals" array, each with:
+- signal_type: Type of signal (search_volume, job_postings, funding, social_mentions, etc.)
+- signal_value: Numerical value if available
+- signal_trend: Trend direction (increasing/decreasing/stable)
+- timeframe: Time period this covers
+- strength: Signal strength (high/medium/low)
+- source_credibility: How credible this source seems (high/medium/low)
 
-    return market_data
+Only return the JSON object, no other text."""
 
 
 def extract_demand_signals(
     search_results: List[Dict[str, str]], keyword: str
 ) -> List[Dict[str, Any]]:
-    """Extract demand signals using Gemini"""
-    demand_signals = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result about "{keyword}" and extract any demand indicators, market signals, or growth metrics.
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of demand signals, each with:
-            - signal_type: Type of signal (search_volume, job_postings, funding, social_mentions, etc.)
-            - signal_value: Numerical value if available
-            - signal_trend: Trend direction (increasing/decreasing/stable)
-            - timeframe: Time period this covers
-            - strength: Signal strength (high/medium/low)
-            - source_credibility: How credible this source seems (high/medium/low)
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Extract demand signals from a batch of results using Gemini"""
+    if not search_results:
+        return []
 
-            if response and response.choices[0].message.content:
-                signals = safe_json_loads(response.choices[0].message.content)
-                demand_signals.extend(signals)
+    try:
+        content = extraction_completion(
+            DEMAND_SIGNALS_PROMPT, search_results_prompt(search_results, keyword)
+        )
 
-        except Exception as e:
-            print(f"Error extracting demand signals: {e}")
-            continue
+        if content:
+            return parse_extracted_items(content, "demand_signals")
+
+    except Exception as e:
+        print(f"Error extracting demand signals: {e}")
 
-    return demand_signals
+    return []
+
+
+PAIN_VALIDATION_PROMPT = """Extract validation of the given pain point from the numbered search results.
+
+Return a JSON object with a "validations" array, each with:
+- validation_type: Type of validation (user_complaint, discussion, review, etc.)
+- validation_strength: How strongly this validates the pain point (high/medium/low)
+- user_segment: What type of users are affected
+- frequency_indicator: How often this pain occurs (daily/weekly/monthly/rare)
+- impact_level: Impact level on users (critical/major/minor)
+- evidence_quote: Brief quote showing the pain point (max 50 words)
+
+Only return the JSON object, no other text."""
 
 
 def extract_pain_validation(
     search_results: List[Dict[str, str]], pain_point: str
 ) -> List[Dict[str, Any]]:
-    """Extract pain point validation using Gemini"""
-    validations = []
-
-    for result in search_results:
-        try:
-            prompt = f"""
-            Analyze this search result for validation of the pain point: "{pain_point}"
-
-            Title: {result.get('title', '')}
-            Content: {result.get('snippet', '')}
-
-            Extract and return a JSON array of validation points, each with:
-            - validation_type: Type of validation (user_complaint, discussion, review, etc.)
-            - validation_strength: How strongly this validates the pain point (high/medium/low)
-            - user_segment: What type of users are affected
-            - frequency_indicator: How often this pain occurs (daily/weekly/monthly/rare)
-            - impact_level: Impact level on users (critical/major/minor)
-            - evidence_quote: Brief quote showing the pain point (max 50 words)
-
-            Only return the JSON array, no other text.
-            """
-
-            response = robust_completion(
-                model=CONFIG["market_research"],
-                api_key=settings.OPENAI_API_KEY,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                temperature=0.3,
-            )
+    """Extract pain point validation from a batch of results using Gemini"""
+    if not search_results:
+        return []
 
-            if response and response.choices[0].message.content:
-                validation_points = safe_json_loads(response.choices[0].message.content)
-                validations.extend(validation_points)
+    try:
+        content = extraction_completion(
+            PAIN_VALIDATION_PROMPT,
+            f'Pain point: "{pain_point}"\n\n{format_search_results(search_results)}',
+        )
 
-        except Exception as e:
-            print(f"Error extracting pain validation: {e}")
-            continue
+        if content:
+            return parse_extracted_items(content, "validations")
+
+    except Exception as e:
+        print(f"Error extracting pain validation: {e}")
+
+    return []
+
+
+# A number followed by an optional scale word or abbreviation, e.g. "5.2 billion",
+# "150M", "$150mn". Longer spellings come first in the alternation, and a scale
+# only counts when no further letter follows it, so "5 mobile apps" stays 5
+MARKET_SIZE_PATTERN = re.compile(
+    r"(\d+(?:\.\d+)?)\s*"
+    r"(?:(trillion|billion|million|thousand|bil|bn|mln|mil|mn|t|b|m|k)s?(?![a-z]))?"
+)
+SIZE_MULTIPLIERS = {
+    "trillion": 1_000_000_000_000,
+    "t": 1_000_000_000_000,
+    "billion": 1_000_000_000,
+    "bil": 1_000_000_000,
+    "bn": 1_000_000_000,
+    "b": 1_000_000_000,
+    "million": 1_000_000,
+    "mln": 1_000_000,
+    "mil": 1_000_000,
+    "mn": 1_000_000,
+    "m": 1_000_000,
+    "thousand": 1_000,
+    "k": 1_000,
+}
+
+
+def parse_scaled_number(text: str) -> Optional[float]:
+    """First number in text times the scale written after it; None if no number"""
+    # Clean the string
+    text = text.lower().replace(",", "").replace("$", "")
+
+    # Extract number and the scale word that directly follows it
+    match = MARKET_SIZE_PATTERN.search(text)
+    if not match:
+        return None
 
-    return validations
+    return float(match.group(1)) * SIZE_MULTIPLIERS.get(match.group(2), 1)
+
+
+def parse_exact_scaled_number(text: str) -> Optional[float]:
+    """Like parse_scaled_number, but only when the whole text is the number"""
+    text = "".join(text.lower().replace(",", "").replace("$", "").split())
+
+    match = MARKET_SIZE_PATTERN.fullmatch(text)
+    if not match:
+        return None
+
+    return float(match.group(1)) * SIZE_MULTIPLIERS.get(match.group(2), 1)
 
 
 def parse_market_size_value(value_str: str) -> float:
@@ -1149,27 +1414,11 @@ def parse_market_size_value(value_str: str) -> float:
     if not value_str:
         return 0.0
 
-    # Clean the string
-    value_str = value_str.lower().replace(",", "").replace("$", "").strip()
+    return parse_scaled_number(value_str) or 0.0
 
-    # Extract number and multiplier
-    number_match = re.search(r"(\d+\.?\d*)", value_str)
-    if not number_match:
-        return 0.0
 
-    number = float(number_match.group(1))
-
-    # Apply multipliers
-    if "trillion" in value_str or "t" in value_str:
-        return number * 1_000_000_000_000
-    elif "billion" in value_str or "b" in value_str:
-        return number * 1_000_000_000
-    elif "million" in value_str or "m" in value_str:
-        return number * 1_000_000
-    elif "thousand" in value_str or "k" in value_str:
-        return number * 1_000
-    else:
-        return number
+MAX_COMPETITORS_PER_CATEGORY = 10
+MAX_MARKET_LEADERS = 5
 
 
 def categorize_competitors(competitors: List[Dict[str, Any]]) -> tuple:
@@ -1183,23 +1432,38 @@ def categorize_competitors(competitors: List[Dict[str, Any]]) -> tuple:
         market_position = competitor.get("market_position", "").lower()
 
         # Categorize as market leader
-        if "leader" in market_position or "dominant" in market_position:
+        if len(market_leaders) < MAX_MARKET_LEADERS and (
+            "leader" in market_position or "dominant" in market_position
+        ):
             market_leaders.append(competitor)
 
         # Categorize by competition type
         if "direct" in comp_type or "software" in comp_type or "platform" in comp_type:
-            direct_competitors.append(competitor)
-        else:
+            if len(direct_competitors) < MAX_COMPETITORS_PER_CATEGORY:
+                direct_competitors.append(competitor)
+        elif len(indirect_competitors) < MAX_COMPETITORS_PER_CATEGORY:
             indirect_competitors.append(competitor)
 
-    return direct_competitors[:10], indirect_competitors[:10], market_leaders[:5]
+        if (
+            len(direct_competitors) == MAX_COMPETITORS_PER_CATEGORY
+            and len(indirect_competitors) == MAX_COMPETITORS_PER_CATEGORY
+            and len(market_leaders) == MAX_MARKET_LEADERS
+        ):
+            break
+
+    return direct_competitors, indirect_competitors, market_leaders
 
 
 def assess_competition_level(competition_data: Dict[str, Any]) -> str:
     """Assess the level of competition"""
     direct_count = len(competition_data.get("direct_competitors", []))
     total_count = direct_count + len(competition_data.get("indirect_competitors", []))
+    return _competition_level(direct_count, total_count)
+
 
+@lru_cache(maxsize=1024)
+def _competition_level(direct_count: int, total_count: int) -> str:
+    """Classify competition from competitor counts"""
     if direct_count <= 2 and total_count <= 5:
         return "low"
     elif direct_count <= 5 and total_count <= 15:
@@ -1221,6 +1485,9 @@ def analyze_market_concentration(competition_data: Dict[str, Any]) -> str:
         return "concentrated"
 
 
+MAX_COMPETITION_GAPS = 5
+
+
 def identify_competition_gaps(
     competition_data: Dict[str, Any], keywords: List[str]
 ) -> List[str]:
@@ -1230,25 +1497,27 @@ def identify_competition_gaps(
     # Check for common gap patterns
     competitors = competition_data.get("direct_competitors", [])
 
-    # Feature gaps
-    common_weaknesses = []
+    # If multiple competitors have same weakness, it's a market gap. The dict
+    # keeps first-appearance order, which is the order gaps are reported in
+    weakness_counts: Dict[str, int] = {}
     for competitor in competitors:
-        weaknesses = competitor.get("weaknesses", [])
-        common_weaknesses.extend(weaknesses)
-
-    # If multiple competitors have same weakness, it's a market gap
-    weakness_counts = Counter(common_weaknesses)
+        for weakness in competitor.get("weaknesses", []):
+            weakness_counts[weakness] = weakness_counts.get(weakness, 0) + 1
 
     for weakness, count in weakness_counts.items():
         if count >= 2:  # Multiple competitors have this weakness
             gaps.append(f"Market gap: {weakness}")
+            if len(gaps) >= MAX_COMPETITION_GAPS:
+                return gaps
 
     # Add keyword-based gaps
     for keyword in keywords:
         if keyword.lower() in ["integration", "automation", "workflow"]:
             gaps.append(f"Potential {keyword} solution gap")
+            if len(gaps) >= MAX_COMPETITION_GAPS:
+                break
 
-    return gaps[:5]
+    return gaps
 
 
 def analyze_competitor_pricing(competition_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -1280,11 +1549,13 @@ def identify_market_segments(
 ) -> List[Dict[str, str]]:
     """Identify market segments from data"""
     segments = []
+    seen_names = set()
 
     # Extract segments mentioned in market data
     for data_point in market_data:
         segment = data_point.get("market_segment", "")
-        if segment and segment not in [s.get("name") for s in segments]:
+        if segment and segment not in seen_names:
+            seen_names.add(segment)
             segments.append(
                 {
                     "name": segment,
@@ -1295,10 +1566,15 @@ def identify_market_segments(
 
     # Add keyword-based segments
     for keyword in keywords:
-        if keyword.lower() in ["enterprise", "small business", "startup"]:
+        name = f"{keyword.title()} Market"
+        if (
+            keyword.lower() in ["enterprise", "small business", "startup"]
+            and name not in seen_names
+        ):
+            seen_names.add(name)
             segments.append(
                 {
-                    "name": f"{keyword.title()} Market",
+                    "name": name,
                     "description": f"Market segment serving {keyword} customers",
                     "size_estimate": "TBD",
                 }
@@ -1307,20 +1583,24 @@ def identify_market_segments(
     return segments[:5]
 
 
+GROWTH_RATE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*%\s*growth", re.I)
+
+
 def calculate_growth_rate(market_data: List[Dict[str, Any]]) -> float:
     """Calculate market growth rate from data"""
-    growth_indicators = []
+    growth_total = 0.0
+    growth_count = 0
 
     for data_point in market_data:
-        if "growth" in str(data_point).lower():
-            # Try to extract growth percentage
-            text = str(data_point).lower()
-            growth_match = re.search(r"(\d+(?:\.\d+)?)\s*%\s*growth", text)
-            if growth_match:
-                growth_indicators.append(float(growth_match.group(1)))
-
-    if growth_indicators:
-        return sum(growth_indicators) / len(growth_indicators)
+        # Only the extracted values can mention growth; keys never match the pattern
+        text = " | ".join(str(value) for value in data_point.values())
+        growth_match = GROWTH_RATE_PATTERN.search(text)
+        if growth_match:
+            growth_total += float(growth_match.group(1))
+            growth_count += 1
+
+    if growth_count:
+        return growth_total / growth_count
     else:
         return 5.0  # Default assumption
 
@@ -1328,38 +1608,43 @@ def calculate_growth_rate(market_data: List[Dict[str, Any]]) -> float:
 def assess_size_confidence(market_size_data: Dict[str, Any]) -> str:
     """Assess confidence in market size calculations"""
     data_points = len(market_size_data.get("data_sources", []))
-    tam_estimate = market_size_data.get("tam_estimate", 0)
+    has_tam = market_size_data.get("tam_estimate", 0) > 0
+    return _size_confidence(data_points, has_tam)
+
 
-    if data_points >= 3 and tam_estimate > 0:
+@lru_cache(maxsize=256)
+def _size_confidence(data_points: int, has_tam: bool) -> str:
+    """Classify market size confidence from source count and TAM presence"""
+    if data_points >= 3 and has_tam:
         return "high"
-    elif data_points >= 2 and tam_estimate > 0:
+    elif data_points >= 2 and has_tam:
         return "medium"
     else:
         return "low"
 
 
+# Base score per signal strength (strength weight x 20)
+SIGNAL_STRENGTH_SCORES = {"high": 20.0, "medium": 12.0, "low": 6.0}
+# Bonus multipliers for high-value signal types
+SIGNAL_TYPE_MULTIPLIERS = {
+    "funding": 1.5,
+    "job_postings": 1.5,
+    "patent_filings": 1.5,
+    "search_volume": 1.2,
+    "social_mentions": 1.2,
+}
+
+
 def calculate_signal_strength_score(demand_sources: List[Dict[str, Any]]) -> float:
     """Calculate overall signal strength score (0-100)"""
     if not demand_sources:
         return 0.0
 
-    total_score = 0.0
-    weights = {"high": 1.0, "medium": 0.6, "low": 0.3}
-
-    for source in demand_sources:
-        strength = source.get("strength", "low")
-        signal_type = source.get("signal_type", "")
-
-        # Base score from strength
-        score = weights.get(strength, 0.3) * 20
-
-        # Bonus for high-value signal types
-        if signal_type in ["funding", "job_postings", "patent_filings"]:
-            score *= 1.5
-        elif signal_type in ["search_volume", "social_mentions"]:
-            score *= 1.2
-
-        total_score += score
+    total_score = sum(
+        SIGNAL_STRENGTH_SCORES.get(source.get("strength", "low"), 6.0)
+        * SIGNAL_TYPE_MULTIPLIERS.get(source.get("signal_type", ""), 1.0)
+        for source in demand_sources
+    )
 
     # Normalize to 0-100 scale
     return min(total_score / len(demand_sources), 100.0)
@@ -1378,23 +1663,15 @@ def extract_demand_metrics(demand_sources: List[Dict[str, Any]]) -> Dict[str, in
 
     for source in demand_sources:
         signal_type = source.get("signal_type", "")
-        signal_value = source.get("signal_value", 0)
-
-        try:
-            value = int(
-                float(
-                    str(signal_value)
-                    .replace(",", "")
-                    .replace("k", "000")
-                    .replace("m", "000000")
-                )
-            )
-            if signal_type in metrics:
-                metrics[signal_type] += value
-        except ValueError:
+        if signal_type not in metrics:
+            continue
+
+        value = parse_exact_scaled_number(str(source.get("signal_value", 0)))
+        if value is not None:
+            metrics[signal_type] += int(value)
+        else:
             # If no numeric value, count as 1 occurrence
-            if signal_type in metrics:
-                metrics[signal_type] += 1
+            metrics[signal_type] += 1
 
     return metrics
 
@@ -1403,7 +1680,11 @@ def assess_validation_confidence(demand_data: Dict[str, Any]) -> str:
     """Assess confidence in demand validation"""
     signal_strength = demand_data.get("signal_strength", 0)
     source_count = len(demand_data.get("demand_sources", []))
+    return _validation_confidence(signal_strength, source_count)
+
 
+def _validation_confidence(signal_strength: float, source_count: int) -> str:
+    """Classify demand validation confidence from strength and source count"""
     if signal_strength >= 70 and source_count >= 5:
         return "high"
     elif signal_strength >= 40 and source_count >= 3:
@@ -1416,7 +1697,11 @@ def assess_market_readiness(demand_data: Dict[str, Any]) -> str:
     """Assess market readiness for the opportunity"""
     signal_strength = demand_data.get("signal_strength", 0)
     validation_confidence = demand_data.get("validation_confidence", "low")
+    return _market_readiness(signal_strength, validation_confidence)
+
 
+def _market_readiness(signal_strength: float, validation_confidence: str) -> str:
+    """Classify market readiness from strength and validation confidence"""
     if signal_strength >= 60 and validation_confidence == "high":
         return "ready"
     elif signal_strength >= 40 and validation_confidence in ["medium", "high"]:
@@ -1471,8 +1756,7 @@ def calculate_tam_sam_som(
         # Calculate TAM
         if tam_values:
             # Use median to avoid outliers
-            tam_values.sort()
-            tam_estimate = tam_values[len(tam_values) // 2]
+            tam_estimate = median_high(tam_values)
             tam_sam_som["tam_estimate"] = int(tam_estimate)
 
             # Calculate SAM (typically 10-30% of TAM for focused markets)
@@ -1518,20 +1802,115 @@ Market Risk Assessment and Recommendation Functions using Gemini AI
 """
 
 
-def assess_market_risks(
-    competition_analysis: Dict[str, Any], trend_analysis: Dict[str, Any]
-) -> Dict[str, Any]:
-    """
-    Assesses market risks using Gemini AI analysis
+RISK_ASSESSMENT_SCHEMA = """{{
+    "overall_risk_level": "low|medium|high",
+    "risk_categories": {{
+        "competitive_risks": [
+            {{
+                "risk": "description of competitive risk",
+                "severity": "low|medium|high",
+                "probability": "low|medium|high",
+                "impact": "description of potential impact",
+                "evidence": "what data supports this risk"
+            }}
+        ],
+        "market_risks": [
+            {{
+                "risk": "description of market risk",
+                "severity": "low|medium|high",
+                "probability": "low|medium|high",
+                "impact": "description of potential impact",
+                "evidence": "what data supports this risk"
+            }}
+        ],
+        "technology_risks": [
+            {{
+                "risk": "description of technology risk",
+                "severity": "low|medium|high",
+                "probability": "low|medium|high",
+                "impact": "description of potential impact",
+                "evidence": "what data supports this risk"
+            }}
+        ],
+        "regulatory_risks": [
+            {{
+                "risk": "description of regulatory risk",
+                "severity": "low|medium|high",
+                "probability": "low|medium|high",
+                "impact": "description of potential impact",
+                "evidence": "what data supports this risk"
+            }}
+        ],
+        "economic_risks": [
+            {{
+                "risk": "description of economic risk",
+                "severity": "low|medium|high",
+                "probability": "low|medium|high",
+                "impact": "description of potential impact",
+                "evidence": "what data supports this risk"
+            }}
+        ]
+    }},
+    "risk_mitigation_strategies": [
+        {{
+            "strategy": "description of mitigation strategy",
+            "addresses_risks": ["list of risks this strategy addresses"],
+            "implementation_difficulty": "low|medium|high",
+            "cost_estimate": "low|medium|high",
+            "effectiveness": "low|medium|high"
+        }}
+    ],
+    "risk_score": number_0_to_100,
+    "critical_risks": [
+        {{
+            "risk": "description of critical risk",
+            "category": "competitive|market|technology|regulatory|economic",
+            "immediate_action_required": true|false,
+            "potential_impact": "description of severe impact"
+        }}
+    ],
+    "risk_timeline": {{
+        "immediate_risks": ["risks that need attention in 0-3 months"],
+        "short_term_risks": ["risks that need attention in 3-12 months"],
+        "long_term_risks": ["risks that need attention in 1+ years"]
+    }},
+    "confidence_level": "low|medium|high",
+    "key_risk_insights": [
+        "3-5 key insights about the risk landscape"
+    ]
+}}"""
+
+RISK_ASSESSMENT_GUIDANCE = """Focus on:
+1. Analyze competition level and market saturation risks
+2. Evaluate trend sustainability and market timing risks
+3. Identify technology disruption potential
+4. Consider regulatory and compliance challenges
+5. Assess economic and market volatility factors
+6. Provide specific, actionable mitigation strategies
+7. Prioritize risks by severity and probability
+
+Base your analysis on the actual data provided, not general assumptions."""
+
+RISK_ASSESSMENT_PROMPT = (
+    """Analyze the following market data and provide a comprehensive risk assessment for entering this market.
+
+Competition Analysis:
+{competition_analysis}
+
+Trend Analysis:
+{trend_analysis}
+
+Please analyze and return a JSON object with the following structure:
+"""
+    + RISK_ASSESSMENT_SCHEMA
+    + "\n\n"
+    + RISK_ASSESSMENT_GUIDANCE
+)
 
-    Args:
-        competition_analysis: Competition analysis data
-        trend_analysis: Trend analysis data
 
-    Returns:
-        Comprehensive risk assessment
-    """
-    risk_assessment = {
+def default_risk_assessment() -> Dict[str, Any]:
+    """Risk assessment skeleton filled in by the model response"""
+    return {
         "overall_risk_level": "medium",
         "risk_categories": {
             "competitive_risks": [],
@@ -1547,154 +1926,160 @@ def assess_market_risks(
         "confidence_level": "medium",
     }
 
-    try:
-        prompt = f"""
-        Analyze the following market data and provide a comprehensive risk assessment for entering this market.
 
-        Competition Analysis:
-        {json.dumps(competition_analysis, indent=2)}
+def risk_assessment_fallback(
+    risk_assessment: Dict[str, Any], error: Exception
+) -> Dict[str, Any]:
+    """Mark a risk assessment as failed and add a basic fallback risk"""
+    risk_assessment["error"] = str(error)
+    risk_assessment["risk_categories"]["market_risks"].append(
+        {
+            "risk": "Analysis error - manual review required",
+            "severity": "medium",
+            "probability": "unknown",
+            "impact": "Could not complete automated risk assessment",
+            "evidence": f"Error: {str(error)}",
+        }
+    )
+    return risk_assessment
+
 
-        Trend Analysis:
-        {json.dumps(trend_analysis, indent=2)}
+def assess_market_risks(
+    competition_analysis: Dict[str, Any], trend_analysis: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Assesses market risks using Gemini AI analysis
 
-        Please analyze and return a JSON object with the following structure:
-        {{
-            "overall_risk_level": "low|medium|high",
-            "risk_categories": {{
-                "competitive_risks": [
-                    {{
-                        "risk": "description of competitive risk",
-                        "severity": "low|medium|high",
-                        "probability": "low|medium|high",
-                        "impact": "description of potential impact",
-                        "evidence": "what data supports this risk"
-                    }}
-                ],
-                "market_risks": [
-                    {{
-                        "risk": "description of market risk",
-                        "severity": "low|medium|high",
-                        "probability": "low|medium|high",
-                        "impact": "description of potential impact",
-                        "evidence": "what data supports this risk"
-                    }}
-                ],
-                "technology_risks": [
-                    {{
-                        "risk": "description of technology risk",
-                        "severity": "low|medium|high",
-                        "probability": "low|medium|high",
-                        "impact": "description of potential impact",
-                        "evidence": "what data supports this risk"
-                    }}
-                ],
-                "regulatory_risks": [
-                    {{
-                        "risk": "description of regulatory risk",
-                        "severity": "low|medium|high",
-                        "probability": "low|medium|high",
-                        "impact": "description of potential impact",
-                        "evidence": "what data supports this risk"
-                    }}
-                ],
-                "economic_risks": [
-                    {{
-                        "risk": "description of economic risk",
-                        "severity": "low|medium|high",
-                        "probability": "low|medium|high",
-                        "impact": "description of potential impact",
-                        "evidence": "what data supports this risk"
-                    }}
-                ]
-            }},
-            "risk_mitigation_strategies": [
-                {{
-                    "strategy": "description of mitigation strategy",
-                    "addresses_risks": ["list of risks this strategy addresses"],
-                    "implementation_difficulty": "low|medium|high",
-                    "cost_estimate": "low|medium|high",
-                    "effectiveness": "low|medium|high"
-                }}
-            ],
-            "risk_score": number_0_to_100,
-            "critical_risks": [
-                {{
-                    "risk": "description of critical risk",
-                    "category": "competitive|market|technology|regulatory|economic",
-                    "immediate_action_required": true|false,
-                    "potential_impact": "description of severe impact"
-                }}
-            ],
-            "risk_timeline": {{
-                "immediate_risks": ["risks that need attention in 0-3 months"],
-                "short_term_risks": ["risks that need attention in 3-12 months"],
-                "long_term_risks": ["risks that need attention in 1+ years"]
-            }},
-            "confidence_level": "low|medium|high",
-            "key_risk_insights": [
-                "3-5 key insights about the risk landscape"
-            ]
-        }}
+    Args:
+        competition_analysis: Competition analysis data
+        trend_analysis: Trend analysis data
 
-        Focus on:
-        1. Analyze competition level and market saturation risks
-        2. Evaluate trend sustainability and market timing risks
-        3. Identify technology disruption potential
-        4. Consider regulatory and compliance challenges
-        5. Assess economic and market volatility factors
-        6. Provide specific, actionable mitigation strategies
-        7. Prioritize risks by severity and probability
+    Returns:
+        Comprehensive risk assessment
+    """
+    risk_assessment = default_risk_assessment()
 
-        Base your analysis on the actual data provided, not general assumptions.
-        """
+    try:
+        prompt = RISK_ASSESSMENT_PROMPT.format_map(
+            {
+                "competition_analysis": prompt_json(competition_analysis),
+                "trend_analysis": prompt_json(trend_analysis),
+            }
+        )
 
-        response = robust_completion(
-            model=CONFIG["market_research"],
-            api_key=settings.OPENAI_API_KEY,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=0.3,
+        content = json_completion(
+            [{"role": "user", "content": prompt}], ANALYSIS_TEMPERATURE
         )
 
-        if response and response.choices[0].message.content:
-            risk_data = safe_json_loads(response.choices[0].message.content)
+        if content:
+            risk_data = safe_json_loads(content)
             risk_assessment.update(risk_data)
 
         return risk_assessment
 
     except Exception as e:
         print(f"Error in assess_market_risks: {e}")
-        risk_assessment["error"] = str(e)
-        # Provide basic fallback analysis
-        risk_assessment["risk_categories"]["market_risks"].append(
-            {
-                "risk": "Analysis error - manual review required",
-                "severity": "medium",
-                "probability": "unknown",
-                "impact": "Could not complete automated risk assessment",
-                "evidence": f"Error: {str(e)}",
-            }
-        )
-        return risk_assessment
+        return risk_assessment_fallback(risk_assessment, e)
+
+
+RECOMMENDATION_SCHEMA = """{{
+    "recommendation": "proceed|proceed_with_caution|analyze_further|pivot|do_not_proceed",
+    "confidence": "low|medium|high",
+    "reasoning": [
+        "Detailed reasoning point 1",
+        "Detailed reasoning point 2",
+        "Detailed reasoning point 3"
+    ],
+    "action_plan": [
+        {{
+            "phase": "immediate|short_term|long_term",
+            "action": "specific action to take",
+            "timeline": "timeframe for this action",
+            "priority": "high|medium|low",
+            "resources_needed": "description of resources required"
+        }}
+    ],
+    "success_probability": number_0_to_100,
+    "investment_recommendation": "aggressive|moderate|cautious|minimal",
+    "timeline_recommendation": "immediate|3-6_months|6-12_months|12+_months",
+    "key_success_factors": [
+        "Critical factor 1 for success",
+        "Critical factor 2 for success",
+        "Critical factor 3 for success"
+    ],
+    "alternative_approaches": [
+        {{
+            "approach": "description of alternative approach",
+            "pros": ["advantage 1", "advantage 2"],
+            "cons": ["disadvantage 1", "disadvantage 2"],
+            "suitability": "high|medium|low"
+        }}
+    ],
+    "next_steps": [
+        {{
+            "step": "specific next step",
+            "priority": "high|medium|low",
+            "timeline": "when to complete this step",
+            "outcome_expected": "what this step should achieve"
+        }}
+    ],
+    "risk_mitigation_priorities": [
+        "Top priority risk to address first",
+        "Second priority risk to address",
+        "Third priority risk to address"
+    ],
+    "market_entry_strategy": {{
+        "recommended_approach": "description of recommended market entry approach",
+        "target_segment": "which market segment to target first",
+        "differentiation_strategy": "how to differentiate from competitors",
+        "pricing_strategy": "recommended pricing approach"
+    }},
+    "success_metrics": [
+        {{
+            "metric": "name of metric to track",
+            "target": "target value or milestone",
+            "timeline": "when to achieve this target"
+        }}
+    ],
+    "decision_factors": {{
+        "go_factors": ["factors supporting proceeding"],
+        "no_go_factors": ["factors against proceeding"],
+        "neutral_factors": ["factors that could go either way"]
+    }}
+}}"""
 
+RECOMMENDATION_GUIDANCE = """Provide specific, actionable recommendations based on:
+1. The opportunity score relative to risk level
+2. Critical risks that must be addressed
+3. Market timing and competitive dynamics
+4. Resource requirements vs. potential returns
+5. Probability of success given current data
 
-def generate_recommendation(
-    opportunity_score: float,
-    risk_assessment: Dict[str, Any],
-    market_data: Dict[str, Any] = None,
-) -> Dict[str, Any]:
-    """
-    Generates intelligent market entry recommendation using Gemini AI
+Be honest about uncertainties and provide clear decision criteria.
+Consider multiple scenarios and provide flexible strategies."""
 
-    Args:
-        opportunity_score: Calculated opportunity score (0-1)
-        risk_assessment: Risk assessment data
-        market_data: Optional additional market data
+RECOMMENDATION_PROMPT = (
+    """Based on the following market analysis data, provide a comprehensive recommendation for this market opportunity.
 
-    Returns:
-        Comprehensive recommendation with reasoning
-    """
-    recommendation = {
+Opportunity Score: {opportunity_score} (scale 0-1, where 1 is highest opportunity)
+
+Risk Assessment:
+{risk_assessment}
+
+Additional Market Data:
+{market_data}
+
+Please analyze all the data and return a JSON object with the following structure:
+"""
+    + RECOMMENDATION_SCHEMA
+    + "\n\n"
+    + RECOMMENDATION_GUIDANCE
+)
+
+
+def default_recommendation() -> Dict[str, Any]:
+    """Recommendation skeleton filled in by the model response"""
+    return {
         "recommendation": "analyze_further",
         "confidence": "medium",
         "reasoning": [],
@@ -1707,106 +2092,64 @@ def generate_recommendation(
         "next_steps": [],
     }
 
-    try:
-        prompt = f"""
-        Based on the following market analysis data, provide a comprehensive recommendation for this market opportunity.
 
-        Opportunity Score: {opportunity_score} (scale 0-1, where 1 is highest opportunity)
+def recommendation_fallback(
+    recommendation: Dict[str, Any], opportunity_score: float, error: Exception
+) -> Dict[str, Any]:
+    """Mark a recommendation as failed and fall back to a score-based call"""
+    recommendation["error"] = str(error)
+
+    # Provide basic fallback recommendation
+    if opportunity_score > 0.7:
+        recommendation["recommendation"] = "proceed_with_caution"
+        recommendation["reasoning"] = ["High opportunity score suggests potential"]
+    elif opportunity_score > 0.5:
+        recommendation["recommendation"] = "analyze_further"
+        recommendation["reasoning"] = [
+            "Moderate opportunity score requires more analysis"
+        ]
+    else:
+        recommendation["recommendation"] = "do_not_proceed"
+        recommendation["reasoning"] = [
+            "Low opportunity score indicates limited potential"
+        ]
 
-        Risk Assessment:
-        {json.dumps(risk_assessment, indent=2)}
+    return recommendation
 
-        Additional Market Data:
-        {json.dumps(market_data or {}, indent=2)}
 
-        Please analyze all the data and return a JSON object with the following structure:
-        {{
-            "recommendation": "proceed|proceed_with_caution|analyze_further|pivot|do_not_proceed",
-            "confidence": "low|medium|high",
-            "reasoning": [
-                "Detailed reasoning point 1",
-                "Detailed reasoning point 2",
-                "Detailed reasoning point 3"
-            ],
-            "action_plan": [
-                {{
-                    "phase": "immediate|short_term|long_term",
-                    "action": "specific action to take",
-                    "timeline": "timeframe for this action",
-                    "priority": "high|medium|low",
-                    "resources_needed": "description of resources required"
-                }}
-            ],
-            "success_probability": number_0_to_100,
-            "investment_recommendation": "aggressive|moderate|cautious|minimal",
-            "timeline_recommendation": "immediate|3-6_months|6-12_months|12+_months",
-            "key_success_factors": [
-                "Critical factor 1 for success",
-                "Critical factor 2 for success",
-                "Critical factor 3 for success"
-            ],
-            "alternative_approaches": [
-                {{
-                    "approach": "description of alternative approach",
-                    "pros": ["advantage 1", "advantage 2"],
-                    "cons": ["disadvantage 1", "disadvantage 2"],
-                    "suitability": "high|medium|low"
-                }}
-            ],
-            "next_steps": [
-                {{
-                    "step": "specific next step",
-                    "priority": "high|medium|low",
-                    "timeline": "when to complete this step",
-                    "outcome_expected": "what this step should achieve"
-                }}
-            ],
-            "risk_mitigation_priorities": [
-                "Top priority risk to address first",
-                "Second priority risk to address",
-                "Third priority risk to address"
-            ],
-            "market_entry_strategy": {{
-                "recommended_approach": "description of recommended market entry approach",
-                "target_segment": "which market segment to target first",
-                "differentiation_strategy": "how to differentiate from competitors",
-                "pricing_strategy": "recommended pricing approach"
-            }},
-            "success_metrics": [
-                {{
-                    "metric": "name of metric to track",
-                    "target": "target value or milestone",
-                    "timeline": "when to achieve this target"
-                }}
-            ],
-            "decision_factors": {{
-                "go_factors": ["factors supporting proceeding"],
-                "no_go_factors": ["factors against proceeding"],
-                "neutral_factors": ["factors that could go either way"]
-            }}
-        }}
+def generate_recommendation(
+    opportunity_score: float,
+    risk_assessment: Dict[str, Any],
+    market_data: Dict[str, Any] = None,
+) -> Dict[str, Any]:
+    """
+    Generates intelligent market entry recommendation using Gemini AI
+
+    Args:
+        opportunity_score: Calculated opportunity score (0-1)
+        risk_assessment: Risk assessment data
+        market_data: Optional additional market data
 
-        Provide specific, actionable recommendations based on:
-        1. The opportunity score relative to risk level
-        2. Critical risks that must be addressed
-        3. Market timing and competitive dynamics
-        4. Resource requirements vs. potential returns
-        5. Probability of success given current data
+    Returns:
+        Comprehensive recommendation with reasoning
+    """
+    recommendation = default_recommendation()
 
-        Be honest about uncertainties and provide clear decision criteria.
-        Consider multiple scenarios and provide flexible strategies.
-        """
+    try:
+        prompt = RECOMMENDATION_PROMPT.format_map(
+            {
+                "opportunity_score": opportunity_score,
+                "risk_assessment": prompt_json(risk_assessment),
+                "market_data": prompt_json(market_data or {}),
+            }
+        )
 
-        response = robust_completion(
-            model=CONFIG["market_research"],
-            api_key=settings.OPENAI_API_KEY,
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-            temperature=0.4,
+        content = json_completion(
+            [{"role": "user", "content": prompt}], CREATIVE_TEMPERATURE
         )
 
-        if response and response.choices[0].message.content:
-            recommendation_data = safe_json_loads(response.choices[0].message.content)
+        if content:
+            recommendation_data = safe_json_loads(content)
             recommendation.update(recommendation_data)
 
         # Add summary recommendation based on score and risk
@@ -1818,24 +2161,7 @@ def generate_recommendation(
 
     except Exception as e:
         print(f"Error in generate_recommendation: {e}")
-        recommendation["error"] = str(e)
-
-        # Provide basic fallback recommendation
-        if opportunity_score > 0.7:
-            recommendation["recommendation"] = "proceed_with_caution"
-            recommendation["reasoning"] = ["High opportunity score suggests potential"]
-        elif opportunity_score > 0.5:
-            recommendation["recommendation"] = "analyze_further"
-            recommendation["reasoning"] = [
-                "Moderate opportunity score requires more analysis"
-            ]
-        else:
-            recommendation["recommendation"] = "do_not_proceed"
-            recommendation["reasoning"] = [
-                "Low opportunity score indicates limited potential"
-            ]
-
-        return recommendation
+        return recommendation_fallback(recommendation, opportunity_score, e)
 
 
 def generate_recommendation_summary(
@@ -1869,6 +2195,94 @@ def generate_recommendation_summary(
         return "Summary generation failed - refer to detailed recommendation data."
 
 
+RISK_AND_RECOMMENDATION_PROMPT = (
+    """Analyze the following market data, assess the risks of entering this market, and then provide a comprehensive recommendation for this market opportunity that accounts for those risks.
+
+Opportunity Score: {opportunity_score} (scale 0-1, where 1 is highest opportunity)
+
+Competition Analysis:
+{competition_analysis}
+
+Trend Analysis:
+{trend_analysis}
+
+Additional Market Data:
+{market_data}
+
+Return a JSON object with two keys:
+- "risk_assessment": an object with the following structure:
+"""
+    + RISK_ASSESSMENT_SCHEMA
+    + """
+- "recommendation": an object with the following structure:
+"""
+    + RECOMMENDATION_SCHEMA
+    + "\n\nFor the risk assessment:\n"
+    + RISK_ASSESSMENT_GUIDANCE
+    + "\n\nFor the recommendation:\n"
+    + RECOMMENDATION_GUIDANCE
+)
+
+
+def assess_risks_and_recommend(
+    opportunity_score: float,
+    competition_analysis: Dict[str, Any],
+    trend_analysis: Dict[str, Any],
+    market_data: Dict[str, Any] = None,
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Assesses market risks and generates the recommendation in one model call
+
+    Args:
+        opportunity_score: Calculated opportunity score (0-1)
+        competition_analysis: Competition analysis data
+        trend_analysis: Trend analysis data
+        market_data: Optional additional market data (without competition)
+
+    Returns:
+        Tuple of (risk assessment, recommendation) shaped like the outputs of
+        assess_market_risks and generate_recommendation
+    """
+    risk_assessment = default_risk_assessment()
+    recommendation = default_recommendation()
+
+    try:
+        prompt = RISK_AND_RECOMMENDATION_PROMPT.format_map(
+            {
+                "opportunity_score": opportunity_score,
+                "competition_analysis": prompt_json(competition_analysis),
+                "trend_analysis": prompt_json(trend_analysis),
+                "market_data": prompt_json(market_data or {}),
+            }
+        )
+
+        # One call means one temperature: the analysis setting is used so the
+        # risk half stays as deterministic as assess_market_risks, which makes the
+        # recommendation half cooler than generate_recommendation's 0.4
+        content = json_completion(
+            [{"role": "user", "content": prompt}], ANALYSIS_TEMPERATURE
+        )
+
+        if content:
+            data = safe_json_loads(content)
+            if isinstance(data, dict):
+                risk_assessment.update(data.get("risk_assessment") or {})
+                recommendation.update(data.get("recommendation") or {})
+
+        recommendation["summary"] = generate_recommendation_summary(
+            opportunity_score, risk_assessment, recommendation
+        )
+
+        return risk_assessment, recommendation
+
+    except Exception as e:
+        print(f"Error in assess_risks_and_recommend: {e}")
+        return (
+            risk_assessment_fallback(risk_assessment, e),
+            recommendation_fallback(recommendation, opportunity_score, e),
+        )
+
+
 def validate_market_opportunity_comprehensive(
     keywords: list,
     target_audience: str,
@@ -1887,8 +2301,12 @@ def validate_market_opportunity_comprehensive(
     Returns:
         Complete market validation report with recommendations
     """
+    started_at = _report_timestamp()
+    started = time.perf_counter()
+    stage_timings = {}
+
     validation_report = {
-        "validation_id": datetime.now().isoformat(),
+        "validation_id": started_at,
         "input_parameters": {
             "keywords": keywords,
             "target_audience": target_audience,
@@ -1902,7 +2320,7 @@ def validate_market_opportunity_comprehensive(
         "risk_assessment": {},
         "opportunity_score": 0.0,
         "final_recommendation": {},
-        "validation_timestamp": datetime.now().isoformat(),
+        "validation_timestamp": started_at,
     }
 
     try:
@@ -1932,6 +2350,7 @@ def validate_market_opportunity_comprehensive(
                 except Exception as e:
                     print(f"Error in {result_key}: {e}")
                     validation_report[result_key] = {}
+                stage_timings[result_key] = time.perf_counter() - started
 
         # Calculate opportunity score
         print("Calculating opportunity score...")
@@ -1946,30 +2365,20 @@ def validate_market_opportunity_comprehensive(
             }
         )
 
-        # Assess risks and generate recommendation in parallel
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            risk_future = executor.submit(
-                assess_market_risks,
-                validation_report["competition_analysis"],
-                validation_report["trend_analysis"],
-            )
-
-            # Wait for risk assessment before generating recommendation
-            validation_report["risk_assessment"] = risk_future.result()
-
-            # Generate recommendation
-            recommendation_future = executor.submit(
-                generate_recommendation,
-                validation_report["opportunity_score"],
-                validation_report["risk_assessment"],
-                {
-                    "market_size": validation_report["market_size_analysis"],
-                    "competition": validation_report["competition_analysis"],
-                    "demand": validation_report["demand_validation"],
-                },
-            )
-
-            validation_report["final_recommendation"] = recommendation_future.result()
+        # Assess risks and generate recommendation in a single model call
+        (
+            validation_report["risk_assessment"],
+            validation_report["final_recommendation"],
+        ) = assess_risks_and_recommend(
+            validation_report["opportunity_score"],
+            validation_report["competition_analysis"],
+            validation_report["trend_analysis"],
+            {
+                "market_size": validation_report["market_size_analysis"],
+                "demand": validation_report["demand_validation"],
+            },
+        )
+        stage_timings["risk_and_recommendation"] = time.perf_counter() - started
 
         print("Market validation completed successfully!")
         return validation_report
@@ -1979,6 +2388,14 @@ def validate_market_opportunity_comprehensive(
         validation_report["error"] = str(e)
         return validation_report
 
+    finally:
+        if settings.COSM_PROFILE:
+            # Seconds from the start of validation until each stage finished
+            stage_timings["total"] = time.perf_counter() - started
+            validation_report["timings"] = {
+                stage: round(elapsed, 3) for stage, elapsed in stage_timings.items()
+            }
+
 
 # Additional utility functions for comprehensive analysis
 
@@ -2044,7 +2461,7 @@ def parallel_domain_check(domain_list: List[str]) -> List[Dict[str, Any]]:
                         "domain": domain,
                         "available": False,
                         "error": str(e),
-                        "checked_at": datetime.now().isoformat(),
+                        "checked_at": _report_timestamp(),
                     }
                 )
 
@@ -2073,7 +2490,7 @@ def multi_market_comparison(
             "best_demand_signals": "",
             "recommended_market": "",
         },
-        "analysis_timestamp": datetime.now().isoformat(),
+        "analysis_timestamp": _report_timestamp(),
     }
 
     try:
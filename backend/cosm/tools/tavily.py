@@ -5,6 +5,10 @@ Removed redundant wrapper functions and consolidated into efficient research sui
 
 from typing import Dict, List, Any
 from datetime import datetime
+import copy
+import re
+import threading
+from cachetools import TTLCache
 from tavily import TavilyClient
 from google.adk.tools import FunctionTool
 from cosm.settings import settings
@@ -223,17 +227,46 @@ def generate_consolidated_insights(
         return insights
 
 
+# Quick searches are repeated across discovery runs, so keep results for a day
+QUICK_SEARCH_CACHE_SIZE = 1024
+QUICK_SEARCH_CACHE_TTL = 24 * 60 * 60
+
+_quick_search_cache = TTLCache(
+    maxsize=QUICK_SEARCH_CACHE_SIZE, ttl=QUICK_SEARCH_CACHE_TTL
+)
+_quick_search_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query used as the cache key"""
+    return re.sub(r"\s+", " ", query.lower()).strip()
+
+
 def tavily_quick_search(query: str, max_results: int = 3) -> Dict[str, Any]:
     """
     OPTIMIZED quick search function for simple queries
     """
-    return tavily_research_suite(
+    cache_key = (normalize_query(query), max_results)
+
+    with _quick_search_lock:
+        cached = _quick_search_cache.get(cache_key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    results = tavily_research_suite(
         query=query,
         research_type="simple",
         max_results=max_results,
         search_depth="basic",
     )
 
+    # Only searches that returned something are cached so failures are retried
+    if results.get("search_results") and not results.get("error"):
+        with _quick_search_lock:
+            _quick_search_cache[cache_key] = copy.deepcopy(results)
+
+    return results
+
 
 def tavily_comprehensive_research(keywords: List[str]) -> Dict[str, Any]:
     """